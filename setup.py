@@ -28,7 +28,7 @@ except FileNotFoundError:
         'zulip>=0.8.0',
         'zulip-bots>=0.8.0',
         'APScheduler==3.10.4',
-        'pytz>=2023.3',
+        'tzdata>=2023.3',
         'requests>=2.31.0',
         'psycopg2-binary>=2.9.0',
     ]
@@ -50,7 +50,7 @@ setup(
     license='MIT',
     packages=find_packages(),
     include_package_data=True,
-    python_requires='>=3.8',
+    python_requires='>=3.9',
     install_requires=requirements,
     extras_require={
         'dev': [
@@ -81,7 +81,6 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.10',
         'Programming Language :: Python :: 3.11',
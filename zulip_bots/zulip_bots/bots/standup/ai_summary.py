@@ -95,7 +95,7 @@ Summary:"""
                 return self._generate_manual_summary(responses, last_day_description)
 
         except Exception as e:
-            logging.error(f"Error generating AI summary with Groq: {e}")
+            logging.error("Error generating AI summary with Groq: %s", e)
             return self._generate_manual_summary(responses, last_day_description)
 
     def _call_groq_api(self, prompt: str) -> Optional[str]:
@@ -140,14 +140,14 @@ Summary:"""
             if 'choices' in result and len(result['choices']) > 0:
                 return result['choices'][0]['message']['content'].strip()
             else:
-                logging.error(f"Unexpected Groq API response format: {result}")
+                logging.error("Unexpected Groq API response format: %s", result)
                 return None
 
         except requests.exceptions.RequestException as e:
-            logging.error(f"Network error calling Groq API: {e}")
+            logging.error("Network error calling Groq API: %s", e)
             return None
         except Exception as e:
-            logging.error(f"Error parsing Groq API response: {e}")
+            logging.error("Error parsing Groq API response: %s", e)
             return None
 
     def _generate_manual_summary(self, responses: List[Dict[str, str]], last_day_description: str = "yesterday") -> str:
@@ -66,7 +66,7 @@ class Config:
 
         # Log warnings for missing configuration
         if missing_vars:
-            logging.warning(f"Missing required environment variables: {', '.join(missing_vars)}")
+            logging.warning("Missing required environment variables: %s", ', '.join(missing_vars))
 
         # Log warning for missing Groq API key
         if not self.groq_api_key:
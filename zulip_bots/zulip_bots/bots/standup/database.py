@@ -5,22 +5,75 @@ Optimized for production use with proper connection handling and thread safety.
 
 import os
 import logging
+import functools
 import sqlite3
 import json
 import threading
-from typing import Any, Dict, List, Optional, Tuple
-import datetime
+import zoneinfo
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import time
 from pathlib import Path
 from contextlib import contextmanager
 
-# Thread-local storage for database connections
+# Thread-local storage for database connections (one per thread)
 _local = threading.local()
 _db_lock = threading.Lock()
 
+# Seconds that cached channel reads stay valid; channel writes clear the cache
+CACHE_TTL = 60
+
+# (function name, args) -> (timestamp, result)
+_cache: Dict[Tuple[str, Tuple[Any, ...]], Tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+# Bumped on every invalidation so reads racing a write don't re-cache stale rows
+_cache_generation = 0
+
+def _copy_result(value: Any) -> Any:
+    """Shallow-copy a cached row or list of rows so callers can't alter the cached value."""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    return value
+
+def ttl_cache(ttl: float = CACHE_TTL) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache a read helper's result for ttl seconds, keyed by its arguments.
+    Each caller gets a shallow copy, so mutating a result leaves the cache intact.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            key = (func.__name__, args)
+            now = time.monotonic()
+            with _cache_lock:
+                entry = _cache.get(key)
+                generation = _cache_generation
+            if entry is not None and now - entry[0] < ttl:
+                return _copy_result(entry[1])
+
+            result = func(*args)
+            with _cache_lock:
+                if generation == _cache_generation:
+                    _cache[key] = (now, result)
+            return _copy_result(result)
+        return wrapper
+    return decorator
+
+def _invalidate_cache() -> None:
+    """Drop all cached channel reads after a channel or participant write."""
+    global _cache_generation
+    with _cache_lock:
+        _cache.clear()
+        _cache_generation += 1
+
+@functools.lru_cache(maxsize=1)
 def get_db_path() -> str:
     """
     Get the database file path. Uses environment variable or default location.
+    Resolved once per process, so the environment lookup and directory
+    creation don't run on every connection; call get_db_path.cache_clear()
+    after changing the environment.
     """
     # Check for DATABASE_URL first (if it's SQLite)
     database_url = os.environ.get('DATABASE_URL')
@@ -43,29 +96,191 @@ def get_db_path() -> str:
     data_dir.mkdir(exist_ok=True)
     return str(data_dir / 'standup.db')
 
+# Schema applied by create_tables in a single executescript call.
+# Every statement is guarded with IF NOT EXISTS so init_db stays idempotent.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    zulip_user_id TEXT UNIQUE NOT NULL,
+    email TEXT,
+    timezone TEXT DEFAULT 'UTC',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS channels (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    zulip_stream_id TEXT UNIQUE NOT NULL,
+    stream_name TEXT,
+    prompt_time TEXT DEFAULT '09:30',
+    cutoff_time TEXT DEFAULT '12:45',
+    reminder_time TEXT DEFAULT '11:45',
+    timezone TEXT DEFAULT 'Africa/Lagos',
+    days TEXT DEFAULT 'mon,tue,wed,thu,fri',
+    holiday_country TEXT DEFAULT 'Nigeria',
+    skip_holidays BOOLEAN DEFAULT 1,
+    is_active BOOLEAN DEFAULT 1,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS channel_participants (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel_id INTEGER,
+    zulip_user_id TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (channel_id) REFERENCES channels(id) ON DELETE CASCADE,
+    UNIQUE(channel_id, zulip_user_id)
+);
+
+CREATE TABLE IF NOT EXISTS standup_responses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    zulip_user_id TEXT,
+    zulip_stream_id TEXT,
+    standup_date DATE,
+    responses TEXT,  -- JSON string
+    completed BOOLEAN DEFAULT 0,
+    submitted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(zulip_user_id, zulip_stream_id, standup_date)
+);
+
+-- Trigram full-text index over standup responses, kept in sync by triggers;
+-- trigrams let LIKE '%term%' substring searches use the index
+CREATE VIRTUAL TABLE IF NOT EXISTS standup_responses_fts USING fts5(
+    responses,
+    content='standup_responses',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS standup_responses_fts_insert AFTER INSERT ON standup_responses BEGIN
+    INSERT INTO standup_responses_fts(rowid, responses) VALUES (new.id, new.responses);
+END;
+
+CREATE TRIGGER IF NOT EXISTS standup_responses_fts_delete AFTER DELETE ON standup_responses BEGIN
+    INSERT INTO standup_responses_fts(standup_responses_fts, rowid, responses)
+    VALUES ('delete', old.id, old.responses);
+END;
+
+CREATE TRIGGER IF NOT EXISTS standup_responses_fts_update AFTER UPDATE ON standup_responses BEGIN
+    INSERT INTO standup_responses_fts(standup_responses_fts, rowid, responses)
+    VALUES ('delete', old.id, old.responses);
+    INSERT INTO standup_responses_fts(rowid, responses) VALUES (new.id, new.responses);
+END;
+
+CREATE TABLE IF NOT EXISTS standup_prompts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    zulip_stream_id TEXT,
+    stream_name TEXT,
+    standup_date DATE,
+    pending_responses TEXT,  -- JSON string
+    prompt_sent BOOLEAN DEFAULT 0,
+    reminder_sent BOOLEAN DEFAULT 0,
+    summary_sent BOOLEAN DEFAULT 0,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(zulip_stream_id, standup_date)
+);
+
+-- Indexes for better performance
+CREATE INDEX IF NOT EXISTS idx_channels_active ON channels(is_active);
+CREATE INDEX IF NOT EXISTS idx_responses_date ON standup_responses(standup_date);
+CREATE INDEX IF NOT EXISTS idx_responses_stream_date ON standup_responses(zulip_stream_id, standup_date DESC);
+CREATE INDEX IF NOT EXISTS idx_prompts_date ON standup_prompts(standup_date);
+CREATE INDEX IF NOT EXISTS idx_participants_channel ON channel_participants(channel_id);
+"""
+
+# Columns added to the channels table after its first release: (name, definition)
+_CHANNEL_MIGRATIONS = (
+    ('days', "TEXT DEFAULT 'mon,tue,wed,thu,fri'"),
+    ('holiday_country', "TEXT DEFAULT 'Nigeria'"),
+    ('skip_holidays', 'BOOLEAN DEFAULT 1'),
+    ('questions', 'TEXT DEFAULT NULL'),
+)
+
+# Tables whose timezone column holds user-entered IANA names
+_TIMEZONE_TABLES = ('channels', 'users')
+
+@functools.lru_cache(maxsize=1)
+def _timezone_names() -> Dict[str, str]:
+    """Lowercased IANA timezone names mapped to their canonical spelling."""
+    return {name.lower(): name for name in zoneinfo.available_timezones()}
+
+def canonical_timezone(name: str) -> Optional[str]:
+    """Return the canonical IANA spelling of a timezone name, matched case-insensitively, or None."""
+    return _timezone_names().get(name.strip().lower())
+
+# Columns holding JSON-encoded text, decoded by _row_factory
+_JSON_COLUMNS = ('responses', 'pending_responses', 'questions')
+
+def _row_factory(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Build each fetched row directly as a dict, decoding JSON-encoded columns."""
+    row_dict = {column[0]: value for column, value in zip(cursor.description, row)}
+    for column in _JSON_COLUMNS:
+        value = row_dict.get(column)
+        if value:
+            try:
+                row_dict[column] = json.loads(value)
+            except ValueError:
+                row_dict[column] = None
+    return row_dict
+
+# Rows fetched per round-trip when streaming multi-row results
+_FETCH_BATCH_SIZE = 256
+
+def _iter_rows(cursor: sqlite3.Cursor) -> Iterator[Dict[str, Any]]:
+    """Yield rows from a cursor in fetchmany batches."""
+    while rows := cursor.fetchmany(_FETCH_BATCH_SIZE):
+        yield from rows
+
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor returning plain tuples, for single-column reads."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+# Prepared statements kept per connection by the sqlite3 module's cache
+_STATEMENT_CACHE_SIZE = 256
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a connection and apply the per-connection PRAGMAs."""
+    conn = sqlite3.connect(db_path, timeout=30.0, cached_statements=_STATEMENT_CACHE_SIZE)
+    conn.row_factory = _row_factory  # Rows are returned as dicts
+    # Only takes effect on a new database file, so it must come before
+    # anything that writes the header (such as switching to WAL)
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    # Enable foreign keys and WAL mode for better concurrency
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # Throughput tuning: memory-mapped reads, larger page cache,
+    # in-memory temp tables and waiting on locks instead of failing
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MB
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA wal_autocheckpoint = 1000")
+    conn.commit()
+    return conn
+
 @contextmanager
 def get_db_connection():
     """
-    Context manager for database connections with proper cleanup.
+    Context manager yielding this thread's database connection.
+    The connection stays open between calls so its prepared-statement
+    cache is reused instead of re-parsing every query.
     """
-    conn = None
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _connect(get_db_path())
+        _local.conn = conn
+
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
-        # Enable foreign keys and WAL mode for better concurrency
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA journal_mode = WAL")
-        conn.execute("PRAGMA synchronous = NORMAL")
-        conn.commit()
         yield conn
-    except Exception as e:
-        if conn:
-            conn.rollback()
+    except Exception:
+        conn.rollback()
         raise
-    finally:
-        if conn:
-            conn.close()
 
 def init_db() -> None:
     """
@@ -76,133 +291,47 @@ def init_db() -> None:
             create_tables(conn)
         logging.info("SQLite database initialized successfully")
     except Exception as e:
-        logging.error(f"Error initializing SQLite database: {e}")
+        logging.error("Error initializing SQLite database: %s", e)
         raise
 
 def create_tables(conn: sqlite3.Connection) -> None:
     """
     Create the necessary tables if they don't exist.
     """
-    cursor = conn.cursor()
+    cursor = _tuple_cursor(conn)
 
-    # Create users table
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        zulip_user_id TEXT UNIQUE NOT NULL,
-        email TEXT,
-        timezone TEXT DEFAULT 'UTC',
-        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-    )
-    """)
-
-    # Create channels table
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS channels (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        zulip_stream_id TEXT UNIQUE NOT NULL,
-        stream_name TEXT,
-        prompt_time TEXT DEFAULT '09:30',
-        cutoff_time TEXT DEFAULT '12:45',
-        reminder_time TEXT DEFAULT '11:45',
-        timezone TEXT DEFAULT 'Africa/Lagos',
-        days TEXT DEFAULT 'mon,tue,wed,thu,fri',
-        holiday_country TEXT DEFAULT 'Nigeria',
-        skip_holidays BOOLEAN DEFAULT 1,
-        is_active BOOLEAN DEFAULT 1,
-        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-    )
-    """)
-    
-    # Add days column to existing channels table if it doesn't exist
-    cursor.execute("""
-    SELECT name FROM pragma_table_info('channels') WHERE name='days'
-    """)
-    if not cursor.fetchone():
-        cursor.execute("""
-        ALTER TABLE channels ADD COLUMN days TEXT DEFAULT 'mon,tue,wed,thu,fri'
-        """)
-    
-    # Add holiday_country column to existing channels table if it doesn't exist
-    cursor.execute("""
-    SELECT name FROM pragma_table_info('channels') WHERE name='holiday_country'
-    """)
-    if not cursor.fetchone():
-        cursor.execute("""
-        ALTER TABLE channels ADD COLUMN holiday_country TEXT DEFAULT 'Nigeria'
-        """)
-    
-    # Add skip_holidays column to existing channels table if it doesn't exist
-    cursor.execute("""
-    SELECT name FROM pragma_table_info('channels') WHERE name='skip_holidays'
-    """)
-    if not cursor.fetchone():
-        cursor.execute("""
-        ALTER TABLE channels ADD COLUMN skip_holidays BOOLEAN DEFAULT 1
-        """)
-
-    # Add questions column to existing channels table if it doesn't exist
-    cursor.execute("""
-    SELECT name FROM pragma_table_info('channels') WHERE name='questions'
-    """)
-    if not cursor.fetchone():
-        cursor.execute("""
-        ALTER TABLE channels ADD COLUMN questions TEXT DEFAULT NULL
-        """)
-
-    # Create channel_participants table
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS channel_participants (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        channel_id INTEGER,
-        zulip_user_id TEXT,
-        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (channel_id) REFERENCES channels(id) ON DELETE CASCADE,
-        UNIQUE(channel_id, zulip_user_id)
-    )
-    """)
-
-    # Create standup_responses table
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS standup_responses (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        zulip_user_id TEXT,
-        zulip_stream_id TEXT,
-        standup_date DATE,
-        responses TEXT,  -- JSON string
-        completed BOOLEAN DEFAULT 0,
-        submitted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        UNIQUE(zulip_user_id, zulip_stream_id, standup_date)
-    )
-    """)
-
-    # Create standup_prompts table
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS standup_prompts (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        zulip_stream_id TEXT,
-        stream_name TEXT,
-        standup_date DATE,
-        pending_responses TEXT,  -- JSON string
-        prompt_sent BOOLEAN DEFAULT 0,
-        reminder_sent BOOLEAN DEFAULT 0,
-        summary_sent BOOLEAN DEFAULT 0,
-        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-        UNIQUE(zulip_stream_id, standup_date)
-    )
-    """)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='standup_responses_fts'")
+    fts_exists = cursor.fetchone() is not None
+
+    conn.executescript(_SCHEMA)
 
-    # Create indexes for better performance
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_channels_active ON channels(is_active)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_responses_date ON standup_responses(standup_date)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_prompts_date ON standup_prompts(standup_date)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_participants_channel ON channel_participants(channel_id)")
+    # Add columns introduced after the channels table was first created
+    existing_columns = {row[1] for row in cursor.execute("PRAGMA table_info(channels)")}
+    for column, definition in _CHANNEL_MIGRATIONS:
+        if column not in existing_columns:
+            cursor.execute(f"ALTER TABLE channels ADD COLUMN {column} {definition}")
+
+    # Timezones were once stored as typed (pytz ignored case); store the canonical names
+    for table in _TIMEZONE_TABLES:
+        stored = [row[0] for row in cursor.execute(f"SELECT DISTINCT timezone FROM {table} WHERE timezone IS NOT NULL")]
+        for timezone in stored:
+            canonical = canonical_timezone(timezone)
+            if canonical and canonical != timezone:
+                cursor.execute(f"UPDATE {table} SET timezone = ? WHERE timezone = ?", (canonical, timezone))
+
+    # Index responses written before the full-text table existed
+    if not fts_exists:
+        cursor.execute("INSERT INTO standup_responses_fts(standup_responses_fts) VALUES ('rebuild')")
 
     conn.commit()
+
+    # auto_vacuum only changes on an existing file through a full VACUUM; convert
+    # databases created before incremental vacuum was enabled, once
+    cursor.execute("PRAGMA auto_vacuum")
+    if cursor.fetchone()[0] == 0:
+        logging.info("Converting database to incremental auto-vacuum")
+        conn.execute("VACUUM")
+
     logging.info("Database tables created successfully")
 
 # User operations
@@ -218,16 +347,13 @@ def get_or_create_user(user_id: str, email: str, timezone: str = 'UTC') -> Dict[
         if user is None:
             # Create the user
             cursor.execute(
-                "INSERT INTO users (zulip_user_id, email, timezone) VALUES (?, ?, ?)",
+                "INSERT INTO users (zulip_user_id, email, timezone) VALUES (?, ?, ?) RETURNING *",
                 (user_id, email, timezone)
             )
-            conn.commit()
-
-            # Get the created user
-            cursor.execute("SELECT * FROM users WHERE zulip_user_id = ?", (user_id,))
             user = cursor.fetchone()
+            conn.commit()
 
-        return dict(user)
+        return user
 
 def update_user_timezone(user_id: str, timezone: str) -> Dict[str, Any]:
     """Update a user's timezone."""
@@ -235,18 +361,16 @@ def update_user_timezone(user_id: str, timezone: str) -> Dict[str, Any]:
         cursor = conn.cursor()
 
         cursor.execute(
-            "UPDATE users SET timezone = ?, updated_at = CURRENT_TIMESTAMP WHERE zulip_user_id = ?",
+            "UPDATE users SET timezone = ?, updated_at = CURRENT_TIMESTAMP WHERE zulip_user_id = ? RETURNING *",
             (timezone, user_id)
         )
+        user = cursor.fetchone()
 
-        if cursor.rowcount == 0:
+        if user is None:
             raise Exception(f"User {user_id} not found")
 
         conn.commit()
-
-        # Get the updated user
-        cursor.execute("SELECT * FROM users WHERE zulip_user_id = ?", (user_id,))
-        return dict(cursor.fetchone())
+        return user
 
 def get_user(user_id: str) -> Optional[Dict[str, Any]]:
     """Get a user by ID."""
@@ -254,12 +378,12 @@ def get_user(user_id: str) -> Optional[Dict[str, Any]]:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM users WHERE zulip_user_id = ?", (user_id,))
         user = cursor.fetchone()
-        return dict(user) if user else None
+        return user
 
 def get_user_timezone(user_id: str) -> str:
     """Get a user's timezone."""
     with get_db_connection() as conn:
-        cursor = conn.cursor()
+        cursor = _tuple_cursor(conn)
         cursor.execute("SELECT timezone FROM users WHERE zulip_user_id = ?", (user_id,))
         result = cursor.fetchone()
         return result[0] if result else 'UTC'
@@ -281,6 +405,7 @@ def get_or_create_channel(stream_id: str, stream_name: str, config: Dict[str, An
                 INSERT INTO channels
                 (zulip_stream_id, stream_name, prompt_time, cutoff_time, reminder_time, timezone, is_active)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
+                RETURNING *
                 """,
                 (
                     stream_id, stream_name,
@@ -291,99 +416,147 @@ def get_or_create_channel(stream_id: str, stream_name: str, config: Dict[str, An
                     config.get('is_active', True)
                 )
             )
-            conn.commit()
-
-            # Get the created channel
-            cursor.execute("SELECT * FROM channels WHERE zulip_stream_id = ?", (stream_id,))
             channel = cursor.fetchone()
+            conn.commit()
+            _invalidate_cache()
 
-        return dict(channel)
+        return channel
 
-def update_channel(stream_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
-    """Update a channel's configuration."""
+def setup_channel(stream_id: str, stream_name: str, config: Dict[str, Any], user_ids: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Create a channel, or re-apply setup to an existing one, and replace its
+    participants in a single transaction. Re-running setup updates the name,
+    times and active flag but keeps timezone, days, holiday and question settings.
+    """
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
-        # Build the update query dynamically
-        update_fields = []
-        params = []
+        cursor.execute(
+            """
+            INSERT INTO channels
+            (zulip_stream_id, stream_name, prompt_time, cutoff_time, reminder_time, timezone, is_active)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(zulip_stream_id) DO UPDATE SET
+                stream_name = excluded.stream_name,
+                prompt_time = excluded.prompt_time,
+                cutoff_time = excluded.cutoff_time,
+                reminder_time = excluded.reminder_time,
+                is_active = excluded.is_active,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING *
+            """,
+            (
+                stream_id, stream_name,
+                config.get('prompt_time', '09:30'),
+                config.get('cutoff_time', '12:45'),
+                config.get('reminder_time', '11:45'),
+                config.get('timezone', 'Africa/Lagos'),
+                config.get('is_active', True)
+            )
+        )
+        channel = cursor.fetchone()
+        _replace_participants(cursor, channel['id'], user_ids)
 
-        for field in ['prompt_time', 'cutoff_time', 'reminder_time', 'timezone', 'is_active', 'stream_name', 'days', 'holiday_country', 'skip_holidays', 'questions']:
-            if field in config:
-                update_fields.append(f"{field} = ?")
-                # Handle JSON serialization for questions
-                if field == 'questions' and isinstance(config[field], list):
-                    params.append(json.dumps(config[field]))
-                else:
-                    params.append(config[field])
+        conn.commit()
+        _invalidate_cache()
+        return channel
+
+# Channel columns that update_channel may change. Absent fields are passed as
+# NULL and kept by COALESCE, so the statement text never varies between calls.
+_CHANNEL_UPDATE_FIELDS = (
+    'prompt_time', 'cutoff_time', 'reminder_time', 'timezone', 'is_active',
+    'stream_name', 'days', 'holiday_country', 'skip_holidays',
+)
+
+# questions may be reset to NULL, so it is guarded by an explicit flag instead
+_UPDATE_CHANNEL_SQL = f"""
+UPDATE channels SET
+    {', '.join(f'{field} = COALESCE(?, {field})' for field in _CHANNEL_UPDATE_FIELDS)},
+    questions = CASE WHEN ? THEN ? ELSE questions END,
+    updated_at = CURRENT_TIMESTAMP
+WHERE zulip_stream_id = ?
+RETURNING *
+"""
 
-        # Add updated_at timestamp
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
+def update_channel(stream_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Update a channel's configuration."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
 
-        if len(update_fields) == 1:  # Only updated_at
+        update_questions = 'questions' in config
+        if not update_questions and not any(field in config for field in _CHANNEL_UPDATE_FIELDS):
             cursor.execute("SELECT * FROM channels WHERE zulip_stream_id = ?", (stream_id,))
             channel = cursor.fetchone()
             if channel is None:
                 raise Exception(f"Channel {stream_id} not found")
-            return dict(channel)
+            return channel
 
-        # Build and execute the query
-        query = f"UPDATE channels SET {', '.join(update_fields)} WHERE zulip_stream_id = ?"
-        params.append(stream_id)
+        # Handle JSON serialization for questions
+        questions = config.get('questions')
+        if isinstance(questions, list):
+            questions = json.dumps(questions)
 
-        cursor.execute(query, params)
+        params = [config.get(field) for field in _CHANNEL_UPDATE_FIELDS]
+        params.extend([update_questions, questions, stream_id])
 
-        if cursor.rowcount == 0:
+        cursor.execute(_UPDATE_CHANNEL_SQL, params)
+        channel = cursor.fetchone()
+
+        if channel is None:
             raise Exception(f"Channel {stream_id} not found")
 
         conn.commit()
+        _invalidate_cache()
+        return channel
 
-        # Get the updated channel
-        cursor.execute("SELECT * FROM channels WHERE zulip_stream_id = ?", (stream_id,))
-        return dict(cursor.fetchone())
-
+@ttl_cache()
 def get_channel(stream_id: str) -> Optional[Dict[str, Any]]:
     """Get a channel by ID."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM channels WHERE zulip_stream_id = ?", (stream_id,))
         channel = cursor.fetchone()
-        if channel:
-            channel_dict = dict(channel)
-            # Parse questions JSON if present
-            if channel_dict.get('questions'):
-                try:
-                    channel_dict['questions'] = json.loads(channel_dict['questions'])
-                except:
-                    channel_dict['questions'] = None
-            return channel_dict
-        return None
+        return channel
 
+@ttl_cache()
+def get_channel_with_counts(stream_id: str) -> Optional[Dict[str, Any]]:
+    """Get a channel by ID along with its participant_count."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT c.*,
+                   (SELECT COUNT(*) FROM channel_participants cp
+                    WHERE cp.channel_id = c.id) AS participant_count
+            FROM channels c
+            WHERE c.zulip_stream_id = ?
+        """, (stream_id,))
+        return cursor.fetchone()
+
+@ttl_cache()
 def get_all_active_channels() -> List[Dict[str, Any]]:
     """Get all active channels."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM channels WHERE is_active = 1")
-        channels = []
-        for channel in cursor.fetchall():
-            channel_dict = dict(channel)
-            # Parse questions JSON if present
-            if channel_dict.get('questions'):
-                try:
-                    channel_dict['questions'] = json.loads(channel_dict['questions'])
-                except:
-                    channel_dict['questions'] = None
-            channels.append(channel_dict)
-        return channels
+        return cursor.fetchall()
 
 # Channel participants operations
-def add_channel_participants(channel_id: str, user_ids: List[str]) -> None:
-    """Add participants to a channel."""
+def _replace_participants(cursor: sqlite3.Cursor, db_channel_id: int, user_ids: Iterable[Any]) -> None:
+    """Replace a channel's participants inside the caller's transaction."""
+    cursor.execute("DELETE FROM channel_participants WHERE channel_id = ?", (db_channel_id,))
+    # Add new participants in one batched statement
+    cursor.executemany(
+        "INSERT OR IGNORE INTO channel_participants (channel_id, zulip_user_id) VALUES (?, ?)",
+        ((db_channel_id, str(user_id)) for user_id in user_ids)
+    )
+
+def add_channel_participants(channel_id: str, user_ids: Iterable[Any]) -> None:
+    """Replace a channel's participants. User IDs are stored as strings."""
     if not user_ids:
         return
 
     with get_db_connection() as conn:
-        cursor = conn.cursor()
+        cursor = _tuple_cursor(conn)
 
         # Get the channel's database ID
         cursor.execute("SELECT id FROM channels WHERE zulip_stream_id = ?", (channel_id,))
@@ -392,24 +565,16 @@ def add_channel_participants(channel_id: str, user_ids: List[str]) -> None:
         if result is None:
             raise Exception(f"Channel {channel_id} not found")
 
-        db_channel_id = result[0]
-
-        # Clear existing participants first
-        cursor.execute("DELETE FROM channel_participants WHERE channel_id = ?", (db_channel_id,))
-
-        # Add new participants
-        for user_id in user_ids:
-            cursor.execute(
-                "INSERT INTO channel_participants (channel_id, zulip_user_id) VALUES (?, ?)",
-                (db_channel_id, user_id)
-            )
+        _replace_participants(cursor, result[0], user_ids)
 
         conn.commit()
+        _invalidate_cache()
 
+@ttl_cache()
 def get_channel_participants(channel_id: str) -> List[str]:
     """Get all participants for a channel."""
     with get_db_connection() as conn:
-        cursor = conn.cursor()
+        cursor = _tuple_cursor(conn)
 
         # Get the channel's database ID
         cursor.execute("SELECT id FROM channels WHERE zulip_stream_id = ?", (channel_id,))
@@ -441,23 +606,15 @@ def create_standup_prompt(stream_id: str, stream_name: str, date: str, pending_r
             INSERT OR REPLACE INTO standup_prompts
             (zulip_stream_id, stream_name, standup_date, pending_responses, prompt_sent, updated_at)
             VALUES (?, ?, ?, ?, 1, CURRENT_TIMESTAMP)
+            RETURNING *
             """,
             (stream_id, stream_name, date, pending_responses_json)
         )
 
-        conn.commit()
-
-        # Get the created/updated prompt
-        cursor.execute(
-            "SELECT * FROM standup_prompts WHERE zulip_stream_id = ? AND standup_date = ?",
-            (stream_id, date)
-        )
-
         prompt = cursor.fetchone()
-        prompt_dict = dict(prompt)
-        prompt_dict['pending_responses'] = json.loads(prompt_dict['pending_responses'])
+        conn.commit()
 
-        return prompt_dict
+        return prompt
 
 def update_standup_prompt(stream_id: str, date: str, pending_responses: List[str]) -> Dict[str, Any]:
     """Update a standup prompt's pending responses."""
@@ -471,26 +628,40 @@ def update_standup_prompt(stream_id: str, date: str, pending_responses: List[str
             UPDATE standup_prompts
             SET pending_responses = ?, updated_at = CURRENT_TIMESTAMP
             WHERE zulip_stream_id = ? AND standup_date = ?
+            RETURNING *
             """,
             (pending_responses_json, stream_id, date)
         )
+        prompt = cursor.fetchone()
 
-        if cursor.rowcount == 0:
+        if prompt is None:
             raise Exception(f"Standup prompt for stream {stream_id} on {date} not found")
 
         conn.commit()
 
-        # Get the updated prompt
-        cursor.execute(
-            "SELECT * FROM standup_prompts WHERE zulip_stream_id = ? AND standup_date = ?",
-            (stream_id, date)
-        )
+        return prompt
 
-        prompt = cursor.fetchone()
-        prompt_dict = dict(prompt)
-        prompt_dict['pending_responses'] = json.loads(prompt_dict['pending_responses'])
+def remove_pending_response(stream_id: str, date: str, user_id: str) -> bool:
+    """Remove a user from a prompt's pending responses. Returns False if they weren't pending."""
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            """
+            UPDATE standup_prompts
+            SET pending_responses = (
+                    SELECT json_group_array(value) FROM json_each(standup_prompts.pending_responses)
+                    WHERE value != ?
+                ),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE zulip_stream_id = ? AND standup_date = ?
+              AND EXISTS (
+                  SELECT 1 FROM json_each(standup_prompts.pending_responses) WHERE value = ?
+              )
+            """,
+            (user_id, stream_id, date, user_id)
+        )
+        conn.commit()
 
-        return prompt_dict
+        return cursor.rowcount > 0
 
 def get_standup_prompt(stream_id: str, date: str) -> Optional[Dict[str, Any]]:
     """Get a standup prompt."""
@@ -505,50 +676,35 @@ def get_standup_prompt(stream_id: str, date: str) -> Optional[Dict[str, Any]]:
         if prompt is None:
             return None
 
-        prompt_dict = dict(prompt)
-        prompt_dict['pending_responses'] = json.loads(prompt_dict['pending_responses'])
-        return prompt_dict
+        return prompt
 
-def get_all_standup_prompts_for_date(date: str) -> List[Dict[str, Any]]:
-    """Get all standup prompts for a specific date."""
+def get_all_standup_prompts_for_date(date: str) -> Iterator[Dict[str, Any]]:
+    """Iterate over all standup prompts for a specific date."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM standup_prompts WHERE standup_date = ?", (date,))
 
-        result = []
-        for prompt in cursor.fetchall():
-            prompt_dict = dict(prompt)
-            prompt_dict['pending_responses'] = json.loads(prompt_dict['pending_responses'])
-            result.append(prompt_dict)
+        yield from _iter_rows(cursor)
 
-        return result
+# Sent-flags on standup_prompts, all set through one shared statement
+_PROMPT_FLAGS = ('prompt_sent', 'reminder_sent', 'summary_sent')
 
-def mark_reminder_sent(stream_id: str, date: str) -> None:
-    """Mark that reminder has been sent for a prompt."""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            UPDATE standup_prompts
-            SET reminder_sent = 1, updated_at = CURRENT_TIMESTAMP
-            WHERE zulip_stream_id = ? AND standup_date = ?
-            """,
-            (stream_id, date)
-        )
-        conn.commit()
+_MARK_PROMPT_FLAG_SQL = f"""
+UPDATE standup_prompts SET
+    {', '.join(f'{flag} = {flag} | ?' for flag in _PROMPT_FLAGS)},
+    updated_at = CURRENT_TIMESTAMP
+WHERE zulip_stream_id = ? AND standup_date = ?
+"""
+
+def mark_prompt_flag(stream_id: str, date: str, flag: str) -> None:
+    """Mark a prompt's prompt_sent, reminder_sent or summary_sent flag."""
+    if flag not in _PROMPT_FLAGS:
+        raise ValueError(f"Unknown standup prompt flag: {flag}")
 
-def mark_summary_sent(stream_id: str, date: str) -> None:
-    """Mark that summary has been sent for a prompt."""
     with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            UPDATE standup_prompts
-            SET summary_sent = 1, updated_at = CURRENT_TIMESTAMP
-            WHERE zulip_stream_id = ? AND standup_date = ?
-            """,
-            (stream_id, date)
-        )
+        params = [flag == name for name in _PROMPT_FLAGS]
+        params.extend([stream_id, date])
+        conn.execute(_MARK_PROMPT_FLAG_SQL, params)
         conn.commit()
 
 # Standup response operations
@@ -579,12 +735,13 @@ def create_or_update_standup_response(
                 INSERT INTO standup_responses
                 (zulip_user_id, zulip_stream_id, standup_date, responses, completed)
                 VALUES (?, ?, ?, ?, 0)
+                RETURNING *
                 """,
                 (user_id, stream_id, date, responses_json)
             )
         else:
             # Update existing response
-            responses = json.loads(existing['responses'])
+            responses = existing['responses']
             responses.append(response_text)
             completed = len(responses) >= num_questions  # Mark completed when all questions answered
             responses_json = json.dumps(responses)
@@ -594,23 +751,15 @@ def create_or_update_standup_response(
                 UPDATE standup_responses
                 SET responses = ?, completed = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE zulip_user_id = ? AND zulip_stream_id = ? AND standup_date = ?
+                RETURNING *
                 """,
                 (responses_json, completed, user_id, stream_id, date)
             )
 
-        conn.commit()
-
-        # Get the created/updated response
-        cursor.execute(
-            "SELECT * FROM standup_responses WHERE zulip_user_id = ? AND zulip_stream_id = ? AND standup_date = ?",
-            (user_id, stream_id, date)
-        )
-
         response = cursor.fetchone()
-        response_dict = dict(response)
-        response_dict['responses'] = json.loads(response_dict['responses'])
+        conn.commit()
 
-        return response_dict
+        return response
 
 def get_standup_response(user_id: str, stream_id: str, date: str) -> Optional[Dict[str, Any]]:
     """Get a standup response."""
@@ -625,12 +774,10 @@ def get_standup_response(user_id: str, stream_id: str, date: str) -> Optional[Di
         if response is None:
             return None
 
-        response_dict = dict(response)
-        response_dict['responses'] = json.loads(response_dict['responses'])
-        return response_dict
+        return response
 
-def get_all_standup_responses_for_stream_and_date(stream_id: str, date: str) -> List[Dict[str, Any]]:
-    """Get all standup responses for a specific stream and date."""
+def get_all_standup_responses_for_stream_and_date(stream_id: str, date: str) -> Iterator[Dict[str, Any]]:
+    """Iterate over all standup responses for a specific stream and date."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
@@ -643,18 +790,12 @@ def get_all_standup_responses_for_stream_and_date(stream_id: str, date: str) ->
             (stream_id, date)
         )
 
-        result = []
-        for response in cursor.fetchall():
-            response_dict = dict(response)
-            response_dict['responses'] = json.loads(response_dict['responses'])
-            result.append(response_dict)
-
-        return result
+        yield from _iter_rows(cursor)
 
 def get_incomplete_responses_for_date(stream_id: str, date: str) -> List[str]:
     """Get user IDs who haven't completed their standup for a given date."""
     with get_db_connection() as conn:
-        cursor = conn.cursor()
+        cursor = _tuple_cursor(conn)
         cursor.execute(
             """
             SELECT zulip_user_id FROM standup_responses
@@ -681,32 +822,27 @@ def get_standup_history_for_stream(stream_id: str, limit: int = 30) -> List[Dict
             """,
             (stream_id, limit)
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
-def search_standup_responses(stream_id: str, search_term: str, limit: int = 20) -> List[Dict[str, Any]]:
-    """Search standup responses for a specific term."""
+def search_standup_responses(stream_id: str, search_term: str, limit: int = 20) -> Iterator[Dict[str, Any]]:
+    """Iterate over standup responses matching a specific term."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
             SELECT sr.*, u.email, c.stream_name
-            FROM standup_responses sr
+            FROM standup_responses_fts f
+            JOIN standup_responses sr ON sr.id = f.rowid
             LEFT JOIN users u ON sr.zulip_user_id = u.zulip_user_id
             LEFT JOIN channels c ON sr.zulip_stream_id = c.zulip_stream_id
-            WHERE sr.zulip_stream_id = ? AND sr.responses LIKE ?
+            WHERE sr.zulip_stream_id = ? AND f.responses LIKE ?
             ORDER BY sr.standup_date DESC, sr.updated_at DESC
             LIMIT ?
             """,
             (stream_id, f'%{search_term}%', limit)
         )
 
-        results = []
-        for row in cursor.fetchall():
-            response_dict = dict(row)
-            response_dict['responses'] = json.loads(response_dict['responses'])
-            results.append(response_dict)
-
-        return results
+        yield from _iter_rows(cursor)
 
 def get_channel_questions(stream_id: str) -> List[str]:
     """Get custom questions for a channel, or return defaults."""
@@ -721,22 +857,38 @@ def get_channel_questions(stream_id: str) -> List[str]:
         "Any blockers or issues you're facing?"
     ]
 
-def cleanup_old_data(days_to_keep: int = 90) -> None:
-    """Clean up old standup data to keep database size manageable."""
-    cutoff_date = (datetime.datetime.now() - datetime.timedelta(days=days_to_keep)).strftime('%Y-%m-%d')
+# Rows deleted per transaction by cleanup_old_data, so the write lock is
+# released between batches instead of being held for the whole purge
+_CLEANUP_BATCH_SIZE = 500
 
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-
-        # Delete old responses
-        cursor.execute("DELETE FROM standup_responses WHERE standup_date < ?", (cutoff_date,))
-        responses_deleted = cursor.rowcount
-
-        # Delete old prompts
-        cursor.execute("DELETE FROM standup_prompts WHERE standup_date < ?", (cutoff_date,))
-        prompts_deleted = cursor.rowcount
+# Free pages returned to the filesystem after each cleanup
+_INCREMENTAL_VACUUM_PAGES = 1000
 
+def _delete_older_than(conn: sqlite3.Connection, table: str, days_to_keep: int) -> int:
+    """Delete rows of a dated table older than days_to_keep in committed batches."""
+    # Standup dates are written in local time, so compare against local 'now'
+    query = f"""
+    DELETE FROM {table} WHERE rowid IN (
+        SELECT rowid FROM {table} WHERE standup_date < date('now', 'localtime', ?) LIMIT ?
+    )
+    """
+    modifier = f'-{days_to_keep} days'
+    deleted = 0
+    while True:
+        batch = conn.execute(query, (modifier, _CLEANUP_BATCH_SIZE)).rowcount
         conn.commit()
+        deleted += batch
+        if batch < _CLEANUP_BATCH_SIZE:
+            return deleted
+
+def cleanup_old_data(days_to_keep: int = 90) -> None:
+    """Clean up old standup data to keep database size manageable."""
+    with get_db_connection() as conn:
+        responses_deleted = _delete_older_than(conn, 'standup_responses', days_to_keep)
+        prompts_deleted = _delete_older_than(conn, 'standup_prompts', days_to_keep)
 
         if responses_deleted > 0 or prompts_deleted > 0:
-            logging.info(f"Cleaned up old data: {responses_deleted} responses, {prompts_deleted} prompts deleted")
+            # Reclaim freed pages without a blocking full VACUUM. executescript
+            # steps the pragma to completion; execute() frees only one page.
+            conn.executescript(f"PRAGMA incremental_vacuum({_INCREMENTAL_VACUUM_PAGES})")
+            logging.info("Cleaned up old data: %s responses, %s prompts deleted", responses_deleted, prompts_deleted)
@@ -14,8 +14,11 @@ import json
 import time
 import logging
 import datetime
+import functools
+import threading
+import concurrent.futures
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
-import pytz
+from zoneinfo import ZoneInfo
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
@@ -26,6 +29,135 @@ import database
 import config
 import ai_summary
 
+# HH:MM in 24-hour time
+_TIME_RE = re.compile(r'^(?:[01]\d|2[0-3]):[0-5]\d$')
+
+# Words that make an @-mention count as addressed to the bot
+_BOT_WORD_RE = re.compile(r'standup|bot', re.IGNORECASE)
+
+# Day names accepted in days config, mapped to weekday numbers (0=Monday)
+_DAY_NUMBERS = {
+    'mon': 0, 'monday': 0,
+    'tue': 1, 'tuesday': 1,
+    'wed': 2, 'wednesday': 2,
+    'thu': 3, 'thursday': 3,
+    'fri': 4, 'friday': 4,
+    'sat': 5, 'saturday': 5,
+    'sun': 6, 'sunday': 6,
+}
+
+# Bare messages that get the usage text
+_HELP_WORDS = frozenset({'help', 'usage'})
+_MAX_HELP_WORD_LEN = max(map(len, _HELP_WORDS))
+
+# Blocker answers that mean "nothing to report"
+_NO_BLOCKERS = frozenset({'none', 'no', 'n/a', '', 'no blockers', 'nothing'})
+
+# Accepted values for `config skip_holidays`
+_TRUE_VALUES = frozenset({'true', 'yes', 'on', '1', 'enable'})
+_FALSE_VALUES = frozenset({'false', 'no', 'off', '0', 'disable'})
+
+# Days-config shortcuts
+_WEEKDAY_WORDS = frozenset({'weekdays', 'workdays'})
+_ALL_DAYS_WORDS = frozenset({'all', 'everyday', 'daily'})
+
+# Setup defaults for (prompt, reminder, cutoff)
+_DEFAULT_STANDUP_TIMES = ["09:30", "11:45", "12:45"]
+
+# Private-message bodies for scheduled prompts and reminders
+_PROMPT_TEMPLATE = """
+👋 Hi **{user_name}**! Time for daily standup in **{stream_name}**.
+
+Please answer: **{question}**"""
+
+_COMMITMENTS_TEMPLATE = """
+
+💡 **Reminder**: {day}, you committed to: _{commitments}_"""
+
+_REMINDER_TEMPLATE = """
+🔔 **Friendly reminder!**
+
+You haven't completed your standup for **{stream_name}** today.
+
+Please respond to complete your standup before the summary is posted.
+"""
+
+# Reply sent once setup has activated a channel
+_SETUP_SUCCESS_TEMPLATE = """
+🎉 **Standup activated for {stream_name}!**
+
+**⏰ Schedule:**
+• **Days:** Weekdays (Mon-Fri)
+• **Prompt:** {prompt_time} (questions sent to team)
+• **Reminder:** {reminder_time} (for non-responders)
+• **Summary:** {cutoff_time} (posted to channel)
+
+**👥 Participants ({participant_count}):**
+{participant_list}
+
+**🚀 What happens next:**
+• Daily prompts will be sent automatically on weekdays
+• Team members respond via private message
+• AI-powered summary posted to this channel
+
+**💡 Customize:**
+• `/standup timezone <your_timezone>` - Set personal timezone
+• `/standup config times HH:MM HH:MM HH:MM` - Adjust schedule
+• `/standup config days all` - Run every day including weekends
+• `/standup config holidays US` - Change holiday country
+• `/standup status` - Check configuration anytime
+
+**🎉 Holiday Support:** Automatically skips Nigerian holidays by default!
+
+Ready to go! 🎯
+"""
+
+# Concurrent private-message sends; kept small to stay inside Zulip's rate limits
+_SEND_WORKERS = 4
+
+
+def _parse_time(time_str: str) -> Tuple[int, int]:
+    """Split an HH:MM string into (hour, minute)."""
+    hour, minute = time_str.split(':')
+    return int(hour), int(minute)
+
+
+def _today_str() -> str:
+    """Today's local date as YYYY-MM-DD, the format standup dates are stored in."""
+    return datetime.date.today().isoformat()
+
+
+# Names accepted by `config holidays` (lowercased) mapped to the stored country name
+_HOLIDAY_COUNTRY_NAMES = {
+    'nigeria': 'Nigeria',
+    'ng': 'Nigeria',
+    'united states': 'United States',
+    'us': 'United States',
+    'usa': 'United States',
+}
+
+# Holiday country names (lowercased) mapped to their holidays calendar class
+_HOLIDAY_CLASS_NAMES = {
+    'nigeria': 'Nigeria',
+    'ng': 'Nigeria',
+    'us': 'UnitedStates',
+    'usa': 'UnitedStates',
+    'united states': 'UnitedStates',
+    'united_states': 'UnitedStates',
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _holiday_dates(holiday_class: type, year: int) -> Dict[datetime.date, str]:
+    """Holiday dates and names for one country calendar and year, built once."""
+    return dict(holiday_class(years=year))
+
+
+@functools.lru_cache(maxsize=256)
+def _cron_trigger(hour: int, minute: int, day_of_week: str, timezone: Any) -> CronTrigger:
+    """Return a shared CronTrigger; triggers are stateless, so jobs with the same schedule can reuse one."""
+    return CronTrigger(hour=hour, minute=minute, day_of_week=day_of_week, timezone=timezone)
+
 
 class StandupHandler(AbstractBotHandler):
     """
@@ -38,6 +170,22 @@ class StandupHandler(AbstractBotHandler):
     - Error recovery
     """
 
+    # Command routing: subcommand -> handler method name
+    _SUBCOMMAND_METHODS = {
+        'setup': '_handle_setup_command',
+        'status': '_handle_status_command',
+        'pause': '_handle_pause_command',
+        'resume': '_handle_resume_command',
+        'timezone': '_handle_timezone_command',
+        'config': '_handle_config_command',
+        'history': '_handle_history_command',
+        'search': '_handle_search_command',
+        'debug': '_handle_debug_command',
+        'test-prompt': '_handle_test_prompt_command',
+        'participants': '_handle_participants_command',
+        'help': '_handle_help_command',
+    }
+
     def usage(self) -> str:
         return """
         **Standup Bot** - Automates daily team standups
@@ -79,6 +227,26 @@ class StandupHandler(AbstractBotHandler):
             logging.info("🚀 Initializing Standup Bot...")
             self.bot_handler = bot_handler
 
+            # Zulip user directory cache: (fetched_at, users by ID, non-bot user IDs),
+            # always replaced as one snapshot
+            self._users_cache: Tuple[float, Dict[str, Dict[str, Any]], Set[str]] = (0.0, {}, set())
+            self._users_lock = threading.Lock()
+
+            # Rendered "Next Scheduled" text per stream: (config signature, text)
+            self._next_run_cache: Dict[str, Tuple[Tuple[Any, ...], str]] = {}
+
+            # Schedule each stream's jobs were built from, so unchanged channels are skipped
+            self._scheduled_signatures: Dict[str, Tuple[str, ...]] = {}
+
+            # Pending responders for one date: (date, {user ID: stream ID}), rebuilt lazily
+            self._pending_index: Optional[Tuple[str, Dict[str, str]]] = None
+            self._pending_index_generation = 0
+
+            # Worker pool for fanning out prompt and reminder DMs
+            self._send_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_SEND_WORKERS, thread_name_prefix='standup-send'
+            )
+
             # Load configuration
             self.config_info = bot_handler.get_config_info('standup', True) or {}
             bot_config = config.config.get_bot_config()
@@ -86,7 +254,7 @@ class StandupHandler(AbstractBotHandler):
                 if key not in self.config_info or not self.config_info[key]:
                     self.config_info[key] = value
 
-            logging.info(f"✅ Configuration loaded: {len(self.config_info)} settings")
+            logging.info("✅ Configuration loaded: %s settings", len(self.config_info))
 
             # Set up AI summary if available
             groq_api_key = self.config_info.get('groq_api_key')
@@ -105,7 +273,7 @@ class StandupHandler(AbstractBotHandler):
             logging.info("🎉 Standup Bot initialized successfully!")
 
         except Exception as e:
-            logging.error(f"❌ Bot initialization failed: {e}", exc_info=True)
+            logging.error("❌ Bot initialization failed: %s", e, exc_info=True)
             raise
 
     def _init_database(self) -> None:
@@ -118,7 +286,7 @@ class StandupHandler(AbstractBotHandler):
             database.cleanup_old_data(days_to_keep=90)
 
         except Exception as e:
-            logging.error(f"❌ Database initialization failed: {e}")
+            logging.error("❌ Database initialization failed: %s", e)
             raise
 
     def _init_scheduler(self) -> None:
@@ -138,7 +306,7 @@ class StandupHandler(AbstractBotHandler):
             self.scheduler = BackgroundScheduler(
                 executors=executors,
                 job_defaults=job_defaults,
-                timezone=pytz.UTC
+                timezone=datetime.timezone.utc
             )
 
             self.scheduler.start()
@@ -150,13 +318,13 @@ class StandupHandler(AbstractBotHandler):
             # Schedule daily maintenance
             self.scheduler.add_job(
                 self._daily_maintenance,
-                CronTrigger(hour=2, minute=0, timezone=pytz.UTC),
+                CronTrigger(hour=2, minute=0, timezone=datetime.timezone.utc),
                 id='daily_maintenance',
                 replace_existing=True
             )
 
         except Exception as e:
-            logging.error(f"❌ Scheduler initialization failed: {e}")
+            logging.error("❌ Scheduler initialization failed: %s", e)
             raise
 
     def handle_message(self, message: Dict[str, Any], bot_handler: AbstractBotHandler) -> None:
@@ -167,42 +335,46 @@ class StandupHandler(AbstractBotHandler):
             message_type = message.get('type', 'unknown')
             stream_name = message.get('display_recipient', 'unknown')
 
-            logging.info(f"📨 RAW MESSAGE: {json.dumps(message, indent=2)}")
-            logging.info(f"📨 Message from {sender_email}: '{content}' (type: {message_type}, stream: {stream_name})")
+            # Serializing the whole message is costly; only do it when DEBUG is on
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("📨 RAW MESSAGE: %s", json.dumps(message))
+            logging.info("📨 Message from %s: '%s' (type: %s, stream: %s)", sender_email, content, message_type, stream_name)
 
-            # DEBUG: Respond to ANY message mentioning the bot
-            if '@' in content and ('standup' in content.lower() or 'bot' in content.lower()):
+            # DEBUG: Respond to ANY message mentioning the bot. Most messages
+            # contain no '@', so only search for the bot words when one is present.
+            has_mention = '@' in content
+            if has_mention and _BOT_WORD_RE.search(content):
                 logging.info("🔧 DEBUG: Bot mentioned, sending test response")
                 try:
                     bot_handler.send_reply(message, "🤖 DEBUG: I can see you mentioned me! Bot is working.")
                     logging.info("✅ DEBUG: Test response sent successfully")
                 except Exception as e:
-                    logging.error(f"❌ DEBUG: Failed to send test response: {e}")
+                    logging.error("❌ DEBUG: Failed to send test response: %s", e)
 
             # Handle standup commands
             if content.startswith('/standup'):
-                logging.info(f"🎯 Processing standup command: {content}")
+                logging.info("🎯 Processing standup command: %s", content)
                 self._handle_standup_command(message, bot_handler)
                 return
 
-            # Handle help requests
-            if content.lower() in ['help', 'usage']:
+            # Handle help requests; the length check skips lowercasing ordinary chatter
+            if len(content) <= _MAX_HELP_WORD_LEN and content.lower() in _HELP_WORDS:
                 bot_handler.send_reply(message, self.usage())
                 return
 
-            # Check if this is a standup response
-            if self._is_standup_response(message):
+            # Check if this is a standup response (only private messages can be)
+            if message_type == 'private' and self._is_standup_response(message):
                 logging.info("📝 Processing standup response")
                 self._handle_standup_response(message, bot_handler)
                 return
 
             # Default response for any message
-            if message_type == 'stream' and '@' in content:
+            if message_type == 'stream' and has_mention:
                 bot_handler.send_reply(message,
                     "Hi! I'm the Standup Bot. Use `/standup help` to see available commands.")
 
         except Exception as e:
-            logging.error(f"❌ Error handling message: {e}", exc_info=True)
+            logging.error("❌ Error handling message: %s", e, exc_info=True)
             try:
                 bot_handler.send_reply(message,
                     "Sorry, I encountered an error processing your message. Please try again.")
@@ -214,7 +386,7 @@ class StandupHandler(AbstractBotHandler):
         content = message['content'].strip()
         parts = content.split()
 
-        logging.info(f"🎯 Processing standup command: {content} (parts: {parts})")
+        logging.info("🎯 Processing standup command: %s (parts: %s)", content, parts)
 
         if len(parts) < 2:
             logging.info("📤 Sending usage reply - no subcommand provided")
@@ -224,79 +396,48 @@ class StandupHandler(AbstractBotHandler):
         subcommand = parts[1].lower()
         args = parts[2:] if len(parts) > 2 else []
 
-        logging.info(f"🔧 Subcommand: '{subcommand}', args: {args}")
-
-        # Command routing
-        handlers = {
-            'setup': self._handle_setup_command,
-            'status': self._handle_status_command,
-            'pause': self._handle_pause_command,
-            'resume': self._handle_resume_command,
-            'timezone': self._handle_timezone_command,
-            'config': self._handle_config_command,
-            'history': self._handle_history_command,
-            'search': self._handle_search_command,
-            'debug': self._handle_debug_command,
-            'test-prompt': self._handle_test_prompt_command,
-            'participants': self._handle_participants_command,
-            'help': lambda m, b, a: bot_handler.send_reply(message, self.usage())
-        }
+        logging.info("🔧 Subcommand: '%s', args: %s", subcommand, args)
 
-        handler = handlers.get(subcommand)
-        if handler:
+        method_name = self._SUBCOMMAND_METHODS.get(subcommand)
+        if method_name:
             try:
-                logging.info(f"🚀 Executing handler for '{subcommand}'")
-                handler(message, bot_handler, args)
-                logging.info(f"✅ Handler for '{subcommand}' completed successfully")
+                logging.info("🚀 Executing handler for '%s'", subcommand)
+                getattr(self, method_name)(message, bot_handler, args)
+                logging.info("✅ Handler for '%s' completed successfully", subcommand)
             except Exception as e:
-                logging.error(f"❌ Error in {subcommand} command: {e}", exc_info=True)
+                logging.error("❌ Error in %s command: %s", subcommand, e, exc_info=True)
                 bot_handler.send_reply(message, f"Error executing {subcommand} command. Please try again.")
         else:
-            logging.warning(f"⚠️ Unknown subcommand: {subcommand}")
+            logging.warning("⚠️ Unknown subcommand: %s", subcommand)
             bot_handler.send_reply(message, f"Unknown command: {subcommand}\n\n{self.usage()}")
 
+    def _handle_help_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
+        """Show usage information."""
+        bot_handler.send_reply(message, self.usage())
+
     def _handle_setup_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
         """Set up standup for a channel."""
-        logging.info(f"🎬 Starting setup command with args: {args}")
+        logging.info("🎬 Starting setup command with args: %s", args)
 
         if message['type'] != 'stream':
             logging.warning("❌ Setup command not in a stream")
             bot_handler.send_reply(message, "❌ This command must be used in a channel (stream).")
             return
 
-        # Default times
-        prompt_time = "09:30"
-        reminder_time = "11:45"
-        cutoff_time = "12:45"
-
-        logging.info(f"📅 Default times: prompt={prompt_time}, reminder={reminder_time}, cutoff={cutoff_time}")
-
-        # Parse and validate arguments
-        if args:
-            logging.info(f"🔍 Validating {len(args)} time arguments")
-            # Validate all provided arguments first
-            for i, time_arg in enumerate(args[:3]):
-                logging.info(f"⏰ Checking time argument {i}: '{time_arg}'")
-                if not self._is_valid_time(time_arg):
-                    logging.error(f"❌ Invalid time format: {time_arg}")
-                    bot_handler.send_reply(message, f"❌ Invalid time format: {time_arg}. Use HH:MM (24-hour format).")
-                    return
+        # Validate the provided times, then fill the rest with defaults
+        provided = args[:3]
+        for time_arg in provided:
+            if not self._is_valid_time(time_arg):
+                logging.error("❌ Invalid time format: %s", time_arg)
+                bot_handler.send_reply(message, f"❌ Invalid time format: {time_arg}. Use HH:MM (24-hour format).")
+                return
 
-            # Now assign the validated times
-            if len(args) >= 1:
-                prompt_time = args[0]
-                logging.info(f"🎯 Set prompt_time to {prompt_time}")
-            if len(args) >= 2:
-                reminder_time = args[1]
-                logging.info(f"🔔 Set reminder_time to {reminder_time}")
-            if len(args) >= 3:
-                cutoff_time = args[2]
-                logging.info(f"✂️ Set cutoff_time to {cutoff_time}")
+        prompt_time, reminder_time, cutoff_time = provided + _DEFAULT_STANDUP_TIMES[len(provided):]
 
         # Validate time sequence
-        logging.info(f"⚖️ Validating time sequence: {prompt_time} < {reminder_time} < {cutoff_time}")
+        logging.info("⚖️ Validating time sequence: %s < %s < %s", prompt_time, reminder_time, cutoff_time)
         if not self._validate_time_sequence(prompt_time, reminder_time, cutoff_time):
-            logging.error(f"❌ Invalid time sequence")
+            logging.error("❌ Invalid time sequence")
             bot_handler.send_reply(message,
                 f"❌ Times must be in order: prompt < reminder < cutoff\n"
                 f"You provided: {prompt_time} < {reminder_time} < {cutoff_time}")
@@ -305,23 +446,23 @@ class StandupHandler(AbstractBotHandler):
         stream_id = str(message['stream_id'])
         stream_name = message['display_recipient']
 
-        logging.info(f"📊 Processing status command for stream {stream_id} ({stream_name})")
+        logging.info("📊 Processing status command for stream %s (%s)", stream_id, stream_name)
 
         try:
             # Get channel subscribers
-            logging.info(f"👥 Getting channel subscribers for {stream_name}")
+            logging.info("👥 Getting channel subscribers for %s", stream_name)
             client = bot_handler._client
             subscribers_response = client.get_subscribers(stream=stream_name)
 
-            logging.info(f"📊 Subscribers response result: {subscribers_response.get('result', 'unknown')}")
+            logging.info("📊 Subscribers response result: %s", subscribers_response.get('result', 'unknown'))
 
             if subscribers_response['result'] != 'success':
-                logging.error(f"❌ Failed to get subscribers: {subscribers_response}")
+                logging.error("❌ Failed to get subscribers: %s", subscribers_response)
                 bot_handler.send_reply(message, "❌ Failed to get channel members.")
                 return
 
             all_subscribers = subscribers_response.get('subscribers', [])
-            logging.info(f"👥 Found {len(all_subscribers)} total subscribers")
+            logging.info("👥 Found %s total subscribers", len(all_subscribers))
 
             if not all_subscribers:
                 logging.warning("⚠️ No subscribers found")
@@ -330,23 +471,19 @@ class StandupHandler(AbstractBotHandler):
 
             # Get user details to filter out bots
             logging.info("👤 Getting user details to filter bots")
-            users_response = client.get_users()
-            if users_response['result'] != 'success':
-                logging.error(f"❌ Failed to get user details: {users_response}")
+            directory = self._get_users_map(bot_handler)
+            if directory is None:
                 bot_handler.send_reply(message, "❌ Failed to get user details.")
                 return
+            # Both come from one cache snapshot, so every human ID is a key of users_map
+            users_map, human_user_ids = directory
 
-            users_map = {u['user_id']: u for u in users_response.get('members', [])}
-            logging.info(f"👤 Got details for {len(users_map)} users")
+            logging.info("👤 Got details for %s users", len(users_map))
 
-            # Filter out bots from subscribers
-            subscribers = []
-            for user_id in all_subscribers:
-                user = users_map.get(user_id)
-                if user and not user.get('is_bot', False):
-                    subscribers.append(user_id)
+            # Filter out bots (and unknown users) from subscribers
+            subscribers = [user_id for user_id in map(str, all_subscribers) if user_id in human_user_ids]
 
-            logging.info(f"🤖 Filtered to {len(subscribers)} non-bot subscribers")
+            logging.info("🤖 Filtered to %s non-bot subscribers", len(subscribers))
 
             if not subscribers:
                 logging.warning("⚠️ No human subscribers found")
@@ -365,61 +502,39 @@ class StandupHandler(AbstractBotHandler):
                 'is_active': True
             }
 
-            logging.info(f"📝 Creating channel configuration: {config_data}")
+            logging.info("📝 Creating channel configuration: %s", config_data)
 
-            # Store in database
+            # Store channel and participants in one transaction
             logging.info("💾 Storing channel in database")
-            database.get_or_create_channel(stream_id, stream_name, config_data)
-            database.add_channel_participants(stream_id, [str(uid) for uid in subscribers])
+            channel = database.setup_channel(stream_id, stream_name, config_data, subscribers)
 
-            # Schedule the standup
+            # Schedule the standup from the stored row, which keeps any existing timezone/days
             logging.info("⏰ Scheduling standup jobs")
-            self._schedule_standup_for_channel(stream_id, config_data)
+            self._schedule_standup_for_channel(stream_id, channel)
 
             # Success message - use the users_map we already have
-            participant_list = "\n".join([
-                f"• {users_map.get(uid, {}).get('full_name', f'User {uid}')}"
-                for uid in subscribers[:10]  # Show first 10
-            ])
-
+            # Every filtered subscriber is a key of users_map
+            participant_lines = [f"• {users_map[uid]['full_name']}" for uid in subscribers[:10]]  # Show first 10
             if len(subscribers) > 10:
-                participant_list += f"\n• ... and {len(subscribers) - 10} more"
+                participant_lines.append(f"• ... and {len(subscribers) - 10} more")
+            participant_list = "\n".join(participant_lines)
 
             logging.info("📤 Sending success message")
             # Success message
-            bot_handler.send_reply(message, f"""
-🎉 **Standup activated for {stream_name}!**
-
-**⏰ Schedule:**
-• **Days:** Weekdays (Mon-Fri)
-• **Prompt:** {self._format_time_with_timezone(prompt_time, config_data['timezone'])} (questions sent to team)
-• **Reminder:** {self._format_time_with_timezone(reminder_time, config_data['timezone'])} (for non-responders)
-• **Summary:** {self._format_time_with_timezone(cutoff_time, config_data['timezone'])} (posted to channel)
-
-**👥 Participants ({len(subscribers)}):**
-{participant_list}
-
-**🚀 What happens next:**
-• Daily prompts will be sent automatically on weekdays
-• Team members respond via private message
-• AI-powered summary posted to this channel
-
-**💡 Customize:**
-• `/standup timezone <your_timezone>` - Set personal timezone
-• `/standup config times HH:MM HH:MM HH:MM` - Adjust schedule
-• `/standup config days all` - Run every day including weekends
-• `/standup config holidays US` - Change holiday country
-• `/standup status` - Check configuration anytime
-
-**🎉 Holiday Support:** Automatically skips Nigerian holidays by default!
-
-Ready to go! 🎯
-""")
+            timezone = channel['timezone']
+            bot_handler.send_reply(message, _SETUP_SUCCESS_TEMPLATE.format(
+                stream_name=stream_name,
+                prompt_time=self._format_time_with_timezone(prompt_time, timezone),
+                reminder_time=self._format_time_with_timezone(reminder_time, timezone),
+                cutoff_time=self._format_time_with_timezone(cutoff_time, timezone),
+                participant_count=len(subscribers),
+                participant_list=participant_list,
+            ))
 
             logging.info("✅ Setup command completed successfully")
 
         except Exception as e:
-            logging.error(f"❌ Setup error for stream {stream_id}: {e}", exc_info=True)
+            logging.error("❌ Setup error for stream %s: %s", stream_id, e, exc_info=True)
             bot_handler.send_reply(message, "❌ Failed to set up standup. Please try again.")
 
     def _handle_status_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -431,18 +546,15 @@ Ready to go! 🎯
         stream_id = str(message['stream_id'])
         stream_name = message['display_recipient']
 
-        logging.info(f"📊 Processing status command for stream {stream_id} ({stream_name})")
+        logging.info("📊 Processing status command for stream %s (%s)", stream_id, stream_name)
 
         try:
-            # Get channel config
-            channel = database.get_channel(stream_id)
+            # Get channel config and participant count in one query
+            channel = database.get_channel_with_counts(stream_id)
             if not channel:
                 bot_handler.send_reply(message, f"❌ Standup not configured for **{stream_name}**.\nUse `/standup setup` to get started!")
                 return
 
-            # Get participants
-            participants = database.get_channel_participants(stream_id)
-
             # Calculate next run times
             timezone = channel.get('timezone', 'Africa/Lagos')
             next_times = self._calculate_next_run_times(channel, timezone)
@@ -475,7 +587,7 @@ Ready to go! 🎯
 • Days: {days_display}
 • Holiday Country: {holiday_country}
 • Skip Holidays: {holiday_status}
-• Participants: {len(participants)} members
+• Participants: {channel['participant_count']} members
 
 **⏰ Schedule:**
 • Prompt: {self._format_time_with_timezone(channel.get('prompt_time', '09:30'), timezone)}
@@ -500,14 +612,13 @@ Ready to go! 🎯
             bot_handler.send_reply(message, status_msg)
 
         except Exception as e:
-            logging.error(f"❌ Status error for stream {stream_id}: {e}", exc_info=True)
+            logging.error("❌ Status error for stream %s: %s", stream_id, e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error retrieving status.")
 
     def _handle_debug_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
         """Show debugging information."""
         try:
-            import datetime
-            now = datetime.datetime.now(pytz.UTC)
+            now = datetime.datetime.now(datetime.timezone.utc)
 
             # Get scheduler info
             jobs = self.scheduler.get_jobs() if hasattr(self, 'scheduler') else []
@@ -515,7 +626,7 @@ Ready to go! 🎯
             # Get database info
             active_channels = database.get_all_active_channels()
 
-            debug_msg = f"""
+            parts = [f"""
 🐛 **Debug Information**
 
 **⏰ Scheduler Status:**
@@ -528,24 +639,26 @@ Ready to go! 🎯
 • Database Path: {database.get_db_path()}
 
 **🔧 Jobs:**
-"""
+"""]
 
             for job in jobs[:10]:  # Show first 10 jobs
                 next_run = getattr(job, 'next_run_time', None)
                 if next_run:
-                    time_until = next_run - now.replace(tzinfo=None)
-                    hours_until = time_until.total_seconds() / 3600
-                    debug_msg += f"• `{job.id}`: {next_run.strftime('%H:%M UTC')} ({hours_until:.1f}h)\n"
+                    # next_run is timezone-aware, like now
+                    hours_until = (next_run - now).total_seconds() / 3600
+                    next_run_utc = next_run.astimezone(datetime.timezone.utc)
+                    parts.append(f"• `{job.id}`: {next_run_utc.strftime('%H:%M UTC')} ({hours_until:.1f}h)\n")
                 else:
-                    debug_msg += f"• `{job.id}`: Next run unknown\n"
+                    parts.append(f"• `{job.id}`: Next run unknown\n")
 
             if len(jobs) > 10:
-                debug_msg += f"• ... and {len(jobs) - 10} more jobs\n"
+                parts.append(f"• ... and {len(jobs) - 10} more jobs\n")
 
-            debug_msg += f"""
+            parts.append("""
 **📈 Channels:**
-"""
+""")
 
+            today = datetime.date.today()
             for channel in active_channels[:5]:  # Show first 5 channels
                 stream_name = channel.get('stream_name', 'Unknown')
                 prompt_time = channel.get('prompt_time', 'N/A')
@@ -554,20 +667,18 @@ Ready to go! 🎯
                 skip_holidays = channel.get('skip_holidays', True)
                 
                 # Check if today is a holiday
-                import datetime
-                today = datetime.date.today()
                 is_holiday_today = self._is_holiday(today, holiday_country) if skip_holidays else False
                 holiday_indicator = " 🎉" if is_holiday_today else ""
                 
-                debug_msg += f"• **{stream_name}**: Prompt at {self._format_time_with_timezone(prompt_time, channel_timezone)}, Holidays: {holiday_country}{holiday_indicator}\n"
+                parts.append(f"• **{stream_name}**: Prompt at {self._format_time_with_timezone(prompt_time, channel_timezone)}, Holidays: {holiday_country}{holiday_indicator}\n")
 
             if len(active_channels) > 5:
-                debug_msg += f"• ... and {len(active_channels) - 5} more channels\n"
+                parts.append(f"• ... and {len(active_channels) - 5} more channels\n")
 
-            bot_handler.send_reply(message, debug_msg)
+            bot_handler.send_reply(message, "".join(parts))
 
         except Exception as e:
-            logging.error(f"❌ Debug command error: {e}", exc_info=True)
+            logging.error("❌ Debug command error: %s", e, exc_info=True)
             bot_handler.send_reply(message, f"❌ Debug error: {str(e)}")
 
     def _handle_test_prompt_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -593,7 +704,7 @@ Ready to go! 🎯
             bot_handler.send_reply(message, "✅ Test prompts sent! Check your private messages.")
 
         except Exception as e:
-            logging.error(f"❌ Test prompt error: {e}", exc_info=True)
+            logging.error("❌ Test prompt error: %s", e, exc_info=True)
             bot_handler.send_reply(message, f"❌ Error sending test prompts: {str(e)}")
 
     def _handle_pause_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -605,7 +716,7 @@ Ready to go! 🎯
         stream_id = str(message['stream_id'])
         stream_name = message['display_recipient']
 
-        logging.info(f"📊 Processing status command for stream {stream_id} ({stream_name})")
+        logging.info("📊 Processing status command for stream %s (%s)", stream_id, stream_name)
 
         try:
             # Check if standup exists
@@ -625,7 +736,7 @@ Ready to go! 🎯
             bot_handler.send_reply(message, f"⏸️ **Standup paused for {stream_name}**\n\nUse `/standup resume` to reactivate.")
 
         except Exception as e:
-            logging.error(f"❌ Pause error: {e}", exc_info=True)
+            logging.error("❌ Pause error: %s", e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error pausing standup.")
 
     def _handle_resume_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -637,7 +748,7 @@ Ready to go! 🎯
         stream_id = str(message['stream_id'])
         stream_name = message['display_recipient']
 
-        logging.info(f"📊 Processing status command for stream {stream_id} ({stream_name})")
+        logging.info("📊 Processing status command for stream %s (%s)", stream_id, stream_name)
 
         try:
             # Check if standup exists
@@ -650,14 +761,14 @@ Ready to go! 🎯
                 bot_handler.send_reply(message, f"✅ Standup is already active for **{stream_name}**.")
                 return
 
-            # Resume the standup
-            database.update_channel(stream_id, {'is_active': True})
+            # Resume the standup, scheduling from the updated (now active) row
+            channel = database.update_channel(stream_id, {'is_active': True})
             self._schedule_standup_for_channel(stream_id, channel)
 
             bot_handler.send_reply(message, f"✅ **Standup resumed for {stream_name}**\n\nDaily standups will continue as scheduled.")
 
         except Exception as e:
-            logging.error(f"❌ Resume error: {e}", exc_info=True)
+            logging.error("❌ Resume error: %s", e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error resuming standup.")
 
     def _handle_timezone_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -674,18 +785,15 @@ Ready to go! 🎯
                 else:
                     bot_handler.send_reply(message, "🌍 You haven't set a timezone yet.\n\nSet it with: `/standup timezone <timezone>` (e.g., `America/New_York`)")
             except Exception as e:
-                logging.error(f"❌ Error retrieving user timezone: {e}")
+                logging.error("❌ Error retrieving user timezone: %s", e)
                 bot_handler.send_reply(message, "❌ Please specify a timezone (e.g., `America/New_York`).")
             return
 
-        timezone_str = args[0]
-
-        # Validate timezone
-        try:
-            pytz.timezone(timezone_str)
-        except pytz.exceptions.UnknownTimeZoneError:
+        # Validate timezone, storing its canonical spelling
+        timezone_str = database.canonical_timezone(args[0])
+        if timezone_str is None:
             bot_handler.send_reply(message,
-                f"❌ Invalid timezone: `{timezone_str}`\n\n"
+                f"❌ Invalid timezone: `{args[0]}`\n\n"
                 "Common timezones:\n"
                 "• `America/New_York`\n"
                 "• `Europe/London`\n"
@@ -702,7 +810,7 @@ Ready to go! 🎯
             bot_handler.send_reply(message, f"✅ Your timezone has been set to **{timezone_str}**.")
 
         except Exception as e:
-            logging.error(f"❌ Timezone error: {e}", exc_info=True)
+            logging.error("❌ Timezone error: %s", e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error setting timezone.")
 
     def _handle_config_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -765,12 +873,11 @@ Ready to go! 🎯
                     'cutoff_time': cutoff_time
                 }
 
-                database.update_channel(stream_id, config_updates)
-                self._reschedule_standup_for_channel(stream_id)
+                channel = database.update_channel(stream_id, config_updates)
+                self._reschedule_standup_for_channel(stream_id, channel)
 
-                # Get UPDATED channel data for timezone display
-                updated_channel = database.get_channel(stream_id)
-                channel_tz = updated_channel.get('timezone', 'Africa/Lagos') if updated_channel else 'Africa/Lagos'
+                # The updated row carries the channel's timezone for display
+                channel_tz = channel.get('timezone', 'Africa/Lagos')
                 bot_handler.send_reply(message, f"""
 ✅ **Schedule updated!**
 • Prompt: {self._format_time_with_timezone(prompt_time, channel_tz)}
@@ -786,17 +893,11 @@ Ready to go! 🎯
                     bot_handler.send_reply(message, f"❌ Invalid time format: {time_value}")
                     return
 
-                # Update the time in database
-                database.update_channel(stream_id, {option: time_value})
-                
-                # Get the UPDATED channel data (with current timezone)
-                updated_channel = database.get_channel(stream_id)
-                if not updated_channel:
-                    bot_handler.send_reply(message, "❌ Error retrieving channel data.")
-                    return
-                    
+                # Update the time in database; the returned row carries the current timezone
+                updated_channel = database.update_channel(stream_id, {option: time_value})
+
                 # Reschedule with the updated data
-                self._reschedule_standup_for_channel(stream_id)
+                self._reschedule_standup_for_channel(stream_id, updated_channel)
                 
                 # Use the updated channel's timezone for display
                 channel_tz = updated_channel.get('timezone', 'Africa/Lagos')
@@ -823,25 +924,18 @@ Ready to go! 🎯
                 parsed_days = self._parse_days_config(days_value)
                 days_display = self._format_days_display(parsed_days)
 
-                database.update_channel(stream_id, {'days': days_value})
-                self._reschedule_standup_for_channel(stream_id)
+                channel = database.update_channel(stream_id, {'days': days_value})
+                self._reschedule_standup_for_channel(stream_id, channel)
 
                 bot_handler.send_reply(message, f"✅ Standup days set to **{days_display}**")
 
             elif option == 'holidays' and len(args) == 2:
                 # Set holiday country
                 country_value = args[1]
-                supported_countries = self._get_supported_countries()
-                
-                # Check if the country is supported
-                country_lower = country_value.lower()
-                valid_country = None
-                for supported in supported_countries:
-                    if country_lower == supported.lower():
-                        valid_country = supported
-                        break
-                
-                if not valid_country:
+
+                # Check if the country is supported, and normalize its name
+                normalized_country = _HOLIDAY_COUNTRY_NAMES.get(country_value.lower())
+                if not normalized_country:
                     bot_handler.send_reply(message, f"""❌ Unsupported holiday country: {country_value}
 
 **Supported countries:**
@@ -851,14 +945,8 @@ Ready to go! 🎯
 **Example:** `/standup config holidays US`""")
                     return
 
-                # Normalize the country name
-                if valid_country.lower() in ['us', 'usa', 'united states']:
-                    normalized_country = 'United States'
-                else:
-                    normalized_country = 'Nigeria'
-
-                database.update_channel(stream_id, {'holiday_country': normalized_country})
-                self._reschedule_standup_for_channel(stream_id)
+                channel = database.update_channel(stream_id, {'holiday_country': normalized_country})
+                self._reschedule_standup_for_channel(stream_id, channel)
 
                 bot_handler.send_reply(message, f"✅ Holiday country set to **{normalized_country}**")
 
@@ -866,10 +954,10 @@ Ready to go! 🎯
                 # Set skip holidays flag
                 skip_value = args[1].lower()
                 
-                if skip_value in ['true', 'yes', 'on', '1', 'enable']:
+                if skip_value in _TRUE_VALUES:
                     skip_holidays = True
                     skip_text = "enabled"
-                elif skip_value in ['false', 'no', 'off', '0', 'disable']:
+                elif skip_value in _FALSE_VALUES:
                     skip_holidays = False
                     skip_text = "disabled"
                 else:
@@ -882,20 +970,16 @@ Ready to go! 🎯
 **Example:** `/standup config skip_holidays true`""")
                     return
 
-                database.update_channel(stream_id, {'skip_holidays': skip_holidays})
-                self._reschedule_standup_for_channel(stream_id)
+                channel = database.update_channel(stream_id, {'skip_holidays': skip_holidays})
+                self._reschedule_standup_for_channel(stream_id, channel)
 
                 bot_handler.send_reply(message, f"✅ Holiday skipping **{skip_text}**")
 
             elif option == 'timezone' and len(args) == 2:
-                # Set channel timezone
-                timezone_value = args[1]
-                
-                # Validate timezone
-                try:
-                    pytz.timezone(timezone_value)
-                except pytz.exceptions.UnknownTimeZoneError:
-                    bot_handler.send_reply(message, f"""❌ Invalid timezone: {timezone_value}
+                # Set channel timezone, validated and stored in its canonical spelling
+                timezone_value = database.canonical_timezone(args[1])
+                if timezone_value is None:
+                    bot_handler.send_reply(message, f"""❌ Invalid timezone: {args[1]}
                     
 **Common timezones:**
 • `America/New_York` (Eastern Time)
@@ -908,17 +992,15 @@ Ready to go! 🎯
 **Example:** `/standup config timezone America/New_York`""")
                     return
 
-                database.update_channel(stream_id, {'timezone': timezone_value})
-                self._reschedule_standup_for_channel(stream_id)
+                channel = database.update_channel(stream_id, {'timezone': timezone_value})
+                self._reschedule_standup_for_channel(stream_id, channel)
 
-                # Get the updated channel to show current schedule
-                updated_channel = database.get_channel(stream_id)
-                if updated_channel:
-                    prompt_time = updated_channel.get('prompt_time', '09:30')
-                    reminder_time = updated_channel.get('reminder_time', '11:45')
-                    cutoff_time = updated_channel.get('cutoff_time', '12:45')
-                    
-                    bot_handler.send_reply(message, f"""✅ Channel timezone set to **{timezone_value}**
+                # Show the current schedule from the updated row
+                prompt_time = channel.get('prompt_time', '09:30')
+                reminder_time = channel.get('reminder_time', '11:45')
+                cutoff_time = channel.get('cutoff_time', '12:45')
+
+                bot_handler.send_reply(message, f"""✅ Channel timezone set to **{timezone_value}**
 
 **📅 Updated Schedule:**
 • Prompt: {self._format_time_with_timezone(prompt_time, timezone_value)}
@@ -926,8 +1008,6 @@ Ready to go! 🎯
 • Summary: {self._format_time_with_timezone(cutoff_time, timezone_value)}
 
 💡 *Note: Individual users can still set their personal timezone with `/standup timezone <tz>`*""")
-                else:
-                    bot_handler.send_reply(message, f"✅ Channel timezone set to **{timezone_value}**\n\n💡 *Note: This affects when standup prompts are sent. Individual users can still set their personal timezone with `/standup timezone <tz>`*")
 
             elif option == 'questions' and len(args) >= 2:
                 # Set custom questions
@@ -978,7 +1058,7 @@ Ready to go! 🎯
                 bot_handler.send_reply(message, "❌ Invalid config command. Use `/standup config` for help.")
 
         except Exception as e:
-            logging.error(f"❌ Config error: {e}", exc_info=True)
+            logging.error("❌ Config error: %s", e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error updating configuration.")
 
     def _handle_history_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -1000,18 +1080,18 @@ Ready to go! 🎯
                 bot_handler.send_reply(message, "📭 No standup history found.")
                 return
 
-            history_msg = f"📊 **Standup History** (Last {len(history)} days)\n\n"
+            parts = [f"📊 **Standup History** (Last {len(history)} days)\n\n"]
 
             for entry in history:
                 date = entry['standup_date']
                 count = entry['response_count']
                 completed = entry.get('completed_count', count)
-                history_msg += f"• **{date}**: {completed}/{count} completed\n"
+                parts.append(f"• **{date}**: {completed}/{count} completed\n")
 
-            bot_handler.send_reply(message, history_msg)
+            bot_handler.send_reply(message, "".join(parts))
 
         except Exception as e:
-            logging.error(f"❌ History error: {e}", exc_info=True)
+            logging.error("❌ History error: %s", e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error retrieving history.")
 
     def _handle_search_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -1028,33 +1108,31 @@ Ready to go! 🎯
         search_term = ' '.join(args)
 
         try:
-            results = database.search_standup_responses(stream_id, search_term, 10)
+            results = list(database.search_standup_responses(stream_id, search_term, 10))
 
             if not results:
                 bot_handler.send_reply(message, f"🔍 No results found for **{search_term}**")
                 return
 
-            search_msg = f"🔍 **Search Results for '{search_term}'**\n\n"
+            parts = [f"🔍 **Search Results for '{search_term}'**\n\n"]
+            needle = search_term.lower()
 
             for result in results:
                 date = result['standup_date']
                 email = result.get('email', 'Unknown')
-                responses = result.get('responses', [])
+                # The database matches the stored JSON text, so keep only rows where
+                # a decoded answer contains the term, and show the first such answer
+                resp = next((r for r in result.get('responses') or [] if needle in r.lower()), None)
+                if resp is None:
+                    continue
 
-                # Find matching responses
-                matching = [r for r in responses if search_term.lower() in r.lower()]
+                truncated = resp[:100] + "..." if len(resp) > 100 else resp
+                parts.append(f"**{date}** - {email}:\n  └ {truncated}\n\n")
 
-                if matching:
-                    search_msg += f"**{date}** - {email}:\n"
-                    for resp in matching[:1]:  # Show first match
-                        truncated = resp[:100] + "..." if len(resp) > 100 else resp
-                        search_msg += f"  └ {truncated}\n"
-                    search_msg += "\n"
-
-            bot_handler.send_reply(message, search_msg)
+            bot_handler.send_reply(message, "".join(parts))
 
         except Exception as e:
-            logging.error(f"❌ Search error: {e}", exc_info=True)
+            logging.error("❌ Search error: %s", e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error performing search.")
 
     def _handle_participants_command(self, message: Dict[str, Any], bot_handler: AbstractBotHandler, args: List[str]) -> None:
@@ -1081,23 +1159,19 @@ Ready to go! 🎯
                 return
 
             # Get user details
-            client = bot_handler._client
-            users_response = client.get_users()
-
-            if users_response['result'] != 'success':
+            directory = self._get_users_map(bot_handler)
+            if directory is None:
                 bot_handler.send_reply(message, "❌ Failed to get user details.")
                 return
-
-            users_map = {u['user_id']: u for u in users_response.get('members', [])}
+            users_map = directory[0]
 
             # Build participant list
             participant_details = []
             for user_id in participants:
-                user_id_int = int(user_id) if isinstance(user_id, str) else user_id
-                user = users_map.get(user_id_int)
+                user = users_map.get(user_id)
                 if user:
                     # Get user's timezone if available
-                    user_data = database.get_user(str(user_id))
+                    user_data = database.get_user(user_id)
                     timezone_info = ""
                     if user_data and user_data.get('timezone'):
                         timezone_info = f" ({user_data['timezone']})"
@@ -1122,8 +1196,7 @@ Ready to go! 🎯
 
 """
 
-            for p in participant_details:
-                participants_msg += f"• **{p['name']}**{p['timezone']}\n"
+            participants_msg += "".join(f"• **{p['name']}**{p['timezone']}\n" for p in participant_details)
 
             participants_msg += f"""
 
@@ -1140,7 +1213,7 @@ Ready to go! 🎯
             bot_handler.send_reply(message, participants_msg)
 
         except Exception as e:
-            logging.error(f"❌ Participants error: {e}", exc_info=True)
+            logging.error("❌ Participants error: %s", e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error retrieving participants.")
 
     def _is_standup_response(self, message: Dict[str, Any]) -> bool:
@@ -1150,41 +1223,53 @@ Ready to go! 🎯
             return False
 
         user_id = str(message['sender_id'])
-        today = datetime.datetime.now().strftime('%Y-%m-%d')
+        today = _today_str()
 
         try:
             # Check if user has any active prompts today
-            prompts = database.get_all_standup_prompts_for_date(today)
-
-            for prompt in prompts:
-                pending = prompt.get('pending_responses', [])
-                if user_id in pending:
-                    return True
-
-            return False
+            return user_id in self._get_pending_index(today)
 
         except Exception as e:
-            logging.error(f"❌ Error checking standup response: {e}")
+            logging.error("❌ Error checking standup response: %s", e)
             return False
 
+    def _get_pending_index(self, date: str) -> Dict[str, str]:
+        """
+        Map each user with a pending prompt on date to the stream it is for.
+        The DB is re-read only after a prompt's pending list changes.
+        """
+        cached = self._pending_index
+        if cached is not None and cached[0] == date:
+            return cached[1]
+
+        generation = self._pending_index_generation
+        index: Dict[str, str] = {}
+        for prompt in database.get_all_standup_prompts_for_date(date):
+            for user_id in prompt.get('pending_responses') or ():
+                index.setdefault(user_id, prompt['zulip_stream_id'])
+
+        # Don't store an index that a concurrent prompt change has already made stale
+        if generation == self._pending_index_generation:
+            self._pending_index = (date, index)
+        return index
+
+    def _invalidate_pending_index(self) -> None:
+        """Drop the pending-responder index after a prompt's pending list changes."""
+        self._pending_index_generation += 1
+        self._pending_index = None
+
     def _handle_standup_response(self, message: Dict[str, Any], bot_handler: AbstractBotHandler) -> None:
         """Handle a standup response from a user."""
         user_id = str(message['sender_id'])
         user_email = message['sender_email']
         content = message['content'].strip()
-        today = datetime.datetime.now().strftime('%Y-%m-%d')
+        today = _today_str()
 
-        logging.info(f"📝 Processing standup response from {user_email}")
+        logging.info("📝 Processing standup response from %s", user_email)
 
         try:
             # Find which stream this response is for
-            prompts = database.get_all_standup_prompts_for_date(today)
-            target_stream_id = None
-
-            for prompt in prompts:
-                if user_id in prompt.get('pending_responses', []):
-                    target_stream_id = prompt['zulip_stream_id']
-                    break
+            target_stream_id = self._get_pending_index(today).get(user_id)
 
             if not target_stream_id:
                 bot_handler.send_reply(message, "❌ No active standup found. Please wait for the next scheduled standup.")
@@ -1219,18 +1304,14 @@ Ready to go! 🎯
 
                 # Remove user from pending responses
                 try:
-                    prompt_data = database.get_standup_prompt(target_stream_id, today)
-                    if prompt_data:
-                        pending = prompt_data.get('pending_responses', [])
-                        if user_id in pending:
-                            pending.remove(user_id)
-                            database.update_standup_prompt(target_stream_id, today, pending)
-                            logging.info(f"✅ User {user_id} removed from pending responses")
+                    if database.remove_pending_response(target_stream_id, today, user_id):
+                        self._invalidate_pending_index()
+                        logging.info("✅ User %s removed from pending responses", user_id)
                 except Exception as e:
-                    logging.error(f"❌ Error updating pending responses: {e}")
+                    logging.error("❌ Error updating pending responses: %s", e)
 
         except Exception as e:
-            logging.error(f"❌ Error handling standup response: {e}", exc_info=True)
+            logging.error("❌ Error handling standup response: %s", e, exc_info=True)
             bot_handler.send_reply(message, "❌ Error processing your response. Please try again.")
 
     # === SCHEDULER METHODS ===
@@ -1239,25 +1320,28 @@ Ready to go! 🎯
         """Schedule all active standups from the database."""
         try:
             active_channels = database.get_all_active_channels()
-            logging.info(f"⏰ Scheduling {len(active_channels)} active standups")
+            logging.info("⏰ Scheduling %s active standups", len(active_channels))
 
-            for channel in active_channels:
-                stream_id = channel['zulip_stream_id']
-                self._schedule_standup_for_channel(stream_id, channel)
+            # Pause so the scheduler wakes up once for the whole batch, not per add_job
+            self.scheduler.pause()
+            try:
+                for channel in active_channels:
+                    stream_id = channel['zulip_stream_id']
+                    self._schedule_standup_for_channel(stream_id, channel)
+            finally:
+                self.scheduler.resume()
 
-            logging.info(f"✅ Successfully scheduled {len(active_channels)} standups")
+            logging.info("✅ Successfully scheduled %s standups", len(active_channels))
 
         except Exception as e:
-            logging.error(f"❌ Error scheduling standups: {e}", exc_info=True)
+            logging.error("❌ Error scheduling standups: %s", e, exc_info=True)
 
     def _schedule_standup_for_channel(self, stream_id: str, channel_config: Dict[str, Any]) -> None:
         """Schedule standup jobs for a specific channel."""
         try:
-            # Unschedule any existing jobs first
-            self._unschedule_standup_for_channel(stream_id)
-
             if not channel_config.get('is_active', True):
-                logging.info(f"⏸️ Channel {stream_id} is paused, skipping scheduling")
+                self._unschedule_standup_for_channel(stream_id)
+                logging.info("⏸️ Channel %s is paused, skipping scheduling", stream_id)
                 return
 
             timezone = channel_config.get('timezone', 'Africa/Lagos')
@@ -1266,21 +1350,31 @@ Ready to go! 🎯
             cutoff_time = channel_config.get('cutoff_time', '12:45')
             days_config = channel_config.get('days', 'mon,tue,wed,thu,fri')
 
+            # Jobs for an unchanged schedule are already in place (the common
+            # case for the daily maintenance pass)
+            signature = (prompt_time, reminder_time, cutoff_time, timezone, days_config)
+            if self._scheduled_signatures.get(stream_id) == signature:
+                return
+
+            # Unschedule any existing jobs first
+            self._unschedule_standup_for_channel(stream_id)
+
             # Parse times
-            prompt_hour, prompt_minute = map(int, prompt_time.split(':'))
-            reminder_hour, reminder_minute = map(int, reminder_time.split(':'))
-            cutoff_hour, cutoff_minute = map(int, cutoff_time.split(':'))
+            prompt_hour, prompt_minute = _parse_time(prompt_time)
+            reminder_hour, reminder_minute = _parse_time(reminder_time)
+            cutoff_hour, cutoff_minute = _parse_time(cutoff_time)
 
             # Parse days
             allowed_days = self._parse_days_config(days_config)
 
             # Get timezone object
-            tz = pytz.timezone(timezone)
+            tz = ZoneInfo(timezone)
+            day_of_week = ','.join(map(str, allowed_days))
 
             # Schedule prompt job
             self.scheduler.add_job(
                 self._send_standup_prompts,
-                CronTrigger(hour=prompt_hour, minute=prompt_minute, day_of_week=','.join(map(str, allowed_days)), timezone=tz),
+                _cron_trigger(prompt_hour, prompt_minute, day_of_week, tz),
                 id=f'prompt_{stream_id}',
                 args=[stream_id],
                 replace_existing=True
@@ -1289,7 +1383,7 @@ Ready to go! 🎯
             # Schedule reminder job
             self.scheduler.add_job(
                 self._send_standup_reminders,
-                CronTrigger(hour=reminder_hour, minute=reminder_minute, day_of_week=','.join(map(str, allowed_days)), timezone=tz),
+                _cron_trigger(reminder_hour, reminder_minute, day_of_week, tz),
                 id=f'reminder_{stream_id}',
                 args=[stream_id],
                 replace_existing=True
@@ -1298,20 +1392,23 @@ Ready to go! 🎯
             # Schedule summary job
             self.scheduler.add_job(
                 self._generate_and_post_summary,
-                CronTrigger(hour=cutoff_hour, minute=cutoff_minute, day_of_week=','.join(map(str, allowed_days)), timezone=tz),
+                _cron_trigger(cutoff_hour, cutoff_minute, day_of_week, tz),
                 id=f'summary_{stream_id}',
                 args=[stream_id],
                 replace_existing=True
             )
 
+            self._scheduled_signatures[stream_id] = signature
+
             days_display = self._format_days_display(allowed_days)
-            logging.info(f"✅ Scheduled standup for stream {stream_id}: {prompt_time}, {reminder_time}, {cutoff_time} ({timezone}) on {days_display}")
+            logging.info("✅ Scheduled standup for stream %s: %s, %s, %s (%s) on %s", stream_id, prompt_time, reminder_time, cutoff_time, timezone, days_display)
 
         except Exception as e:
-            logging.error(f"❌ Error scheduling standup for stream {stream_id}: {e}", exc_info=True)
+            logging.error("❌ Error scheduling standup for stream %s: %s", stream_id, e, exc_info=True)
 
     def _unschedule_standup_for_channel(self, stream_id: str) -> None:
         """Remove all scheduled jobs for a channel."""
+        self._scheduled_signatures.pop(stream_id, None)
         job_ids = [f'prompt_{stream_id}', f'reminder_{stream_id}', f'summary_{stream_id}']
 
         for job_id in job_ids:
@@ -1320,33 +1417,34 @@ Ready to go! 🎯
             except:
                 pass  # Job might not exist
 
-        logging.info(f"🗑️ Unscheduled standup jobs for stream {stream_id}")
+        logging.info("🗑️ Unscheduled standup jobs for stream %s", stream_id)
 
-    def _reschedule_standup_for_channel(self, stream_id: str) -> None:
-        """Reschedule standup for a channel after config changes."""
+    def _reschedule_standup_for_channel(self, stream_id: str, channel: Optional[Dict[str, Any]] = None) -> None:
+        """Reschedule standup for a channel after config changes, from its updated row when given."""
+        self._next_run_cache.pop(stream_id, None)
         try:
-            channel = database.get_channel(stream_id)
+            if channel is None:
+                channel = database.get_channel(stream_id)
             if channel:
                 self._schedule_standup_for_channel(stream_id, channel)
-                logging.info(f"🔄 Rescheduled standup for stream {stream_id}")
+                logging.info("🔄 Rescheduled standup for stream %s", stream_id)
         except Exception as e:
-            logging.error(f"❌ Error rescheduling standup for stream {stream_id}: {e}")
+            logging.error("❌ Error rescheduling standup for stream %s: %s", stream_id, e)
 
     # === STANDUP EXECUTION METHODS ===
 
     def _send_standup_prompts(self, stream_id: str) -> None:
         """Send standup prompts to all participants."""
         try:
-            logging.info(f"📤 Sending standup prompts for stream {stream_id}")
+            logging.info("📤 Sending standup prompts for stream %s", stream_id)
 
             # Get channel configuration
             channel = database.get_channel(stream_id)
             if not channel or not channel.get('is_active', True):
-                logging.info(f"⏸️ Channel {stream_id} is not active, skipping prompts")
+                logging.info("⏸️ Channel %s is not active, skipping prompts", stream_id)
                 return
 
             # Check if today is a holiday and we should skip
-            import datetime
             today = datetime.date.today()
             if not self._should_run_standup_on_date(today, channel):
                 skip_holidays = channel.get('skip_holidays', True)
@@ -1354,26 +1452,27 @@ Ready to go! 🎯
                 
                 if skip_holidays and self._is_holiday(today, holiday_country):
                     holiday_name = self._get_holiday_name(today, holiday_country)
-                    logging.info(f"🎉 Skipping standup for stream {stream_id} - Today is {holiday_name} in {holiday_country}")
+                    logging.info("🎉 Skipping standup for stream %s - Today is %s in %s", stream_id, holiday_name, holiday_country)
                 else:
-                    logging.info(f"📅 Skipping standup for stream {stream_id} - Today is not a configured standup day")
+                    logging.info("📅 Skipping standup for stream %s - Today is not a configured standup day", stream_id)
                 return
 
             # Get participants
             participants = database.get_channel_participants(stream_id)
             if not participants:
-                logging.warning(f"⚠️ No participants found for stream {stream_id}")
+                logging.warning("⚠️ No participants found for stream %s", stream_id)
                 return
 
             stream_name = channel.get('stream_name', 'Unknown')
-            today = datetime.datetime.now().strftime('%Y-%m-%d')
+            today = _today_str()
 
             # Create prompt record
-            database.create_standup_prompt(stream_id, stream_name, today, participants.copy())
+            database.create_standup_prompt(stream_id, stream_name, today, participants)
+            self._invalidate_pending_index()
 
             # Calculate the last standup day for dynamic prompt
             last_date, last_day_description = self._get_last_standup_day(channel)
-            logging.info(f"📅 Last standup day for {stream_name}: {last_day_description} ({last_date})")
+            logging.info("📅 Last standup day for %s: %s (%s)", stream_name, last_day_description, last_date)
 
             # Get custom questions for this channel
             questions = database.get_channel_questions(stream_id)
@@ -1382,79 +1481,71 @@ Ready to go! 🎯
             first_question = first_question.replace('{last_day}', last_day_description)
 
             # Get user details
-            client = self.bot_handler._client
-            users_response = client.get_users()
-
-            if users_response['result'] != 'success':
-                logging.error(f"❌ Failed to get user details for stream {stream_id}")
+            directory = self._get_users_map(self.bot_handler)
+            if directory is None:
+                logging.error("❌ Failed to get user details for stream %s", stream_id)
                 return
+            users_map = directory[0]
 
-            users_map = {u['user_id']: u for u in users_response.get('members', [])}
+            # Parts of the prompt that are the same for every participant
+            show_commitments = bool(questions) and '{last_day}' in questions[0]
+            day_label = last_day_description.capitalize()
+            num_questions = len(questions)
+            more_questions = ""
+            if num_questions > 1:
+                more_questions = f"""
 
-            # Send prompts to all participants
-            successful_sends = 0
-            for user_id in participants:
-                user_id_int = int(user_id) if isinstance(user_id, str) else user_id
+(I'll ask you {num_questions - 1} more question{'s' if num_questions > 2 else ''} after this one)
+"""
 
-                if user_id_int in users_map:
-                    user = users_map[user_id_int]
+            # Build prompts for all participants, then send them concurrently
+            outgoing = []
+            for user_id in participants:
+                user = users_map.get(user_id)
+                if user:
                     user_email = user['email']
-                    user_name = user['full_name']
 
                     # Get previous commitments for this user
-                    previous_commitments = self._get_user_previous_commitments(str(user_id), stream_id, last_date)
-                    
-                    # Build the prompt message
-                    prompt_message = f"""
-👋 Hi **{user_name}**! Time for daily standup in **{stream_name}**.
+                    previous_commitments = self._get_user_previous_commitments(user_id, stream_id, last_date)
 
-Please answer: **{first_question}**"""
+                    # Build the prompt message
+                    prompt_message = _PROMPT_TEMPLATE.format(
+                        user_name=user['full_name'], stream_name=stream_name, question=first_question
+                    )
 
                     # Add previous commitments if available (only if it's about yesterday/past work)
-                    if previous_commitments and '{last_day}' in questions[0]:
-                        prompt_message += f"""
+                    if previous_commitments and show_commitments:
+                        prompt_message += _COMMITMENTS_TEMPLATE.format(day=day_label, commitments=previous_commitments)
 
-💡 **Reminder**: {last_day_description.capitalize()}, you committed to: _{previous_commitments}_"""
+                    prompt_message += more_questions
 
-                    num_questions = len(questions)
-                    if num_questions > 1:
-                        prompt_message += f"""
+                    outgoing.append((user_email, prompt_message))
 
-(I'll ask you {num_questions - 1} more question{'s' if num_questions > 2 else ''} after this one)
-"""
-
-                    try:
-                        self._send_private_message(self.bot_handler, user_email, prompt_message)
-                        successful_sends += 1
-                        logging.info(f"✅ Sent prompt to {user_email}")
-                    except Exception as e:
-                        logging.error(f"❌ Failed to send prompt to {user_email}: {e}")
-
-            logging.info(f"📤 Sent {successful_sends}/{len(participants)} standup prompts for stream {stream_id}")
+            successful_sends = self._send_private_messages(outgoing, 'prompt')
+            logging.info("📤 Sent %s/%s standup prompts for stream %s", successful_sends, len(participants), stream_id)
 
         except Exception as e:
-            logging.error(f"❌ Error sending prompts for stream {stream_id}: {e}", exc_info=True)
+            logging.error("❌ Error sending prompts for stream %s: %s", stream_id, e, exc_info=True)
 
     def _send_standup_reminders(self, stream_id: str) -> None:
         """Send reminders to users who haven't responded."""
         try:
-            logging.info(f"🔔 Sending reminders for stream {stream_id}")
+            logging.info("🔔 Sending reminders for stream %s", stream_id)
 
             # Check if today is a holiday and we should skip
             channel = database.get_channel(stream_id)
             if channel:
-                import datetime
                 today_date = datetime.date.today()
                 if not self._should_run_standup_on_date(today_date, channel):
-                    logging.info(f"📅 Skipping reminders for stream {stream_id} - Not a standup day")
+                    logging.info("📅 Skipping reminders for stream %s - Not a standup day", stream_id)
                     return
 
-            today = datetime.datetime.now().strftime('%Y-%m-%d')
+            today = _today_str()
 
             # Get prompt data
             prompt_data = database.get_standup_prompt(stream_id, today)
             if not prompt_data:
-                logging.warning(f"⚠️ No prompt data found for stream {stream_id} on {today}")
+                logging.warning("⚠️ No prompt data found for stream %s on %s", stream_id, today)
                 return
 
             # Get users who haven't completed their standup
@@ -1462,75 +1553,59 @@ Please answer: **{first_question}**"""
             pending_responses = prompt_data.get('pending_responses', [])
 
             # Users who haven't responded at all
-            no_response_users = [uid for uid in pending_responses if uid not in incomplete_users]
+            incomplete_set = set(incomplete_users)
+            no_response_users = [uid for uid in pending_responses if uid not in incomplete_set]
 
             reminder_users = incomplete_users + no_response_users
 
             if not reminder_users:
-                logging.info(f"✅ No reminders needed for stream {stream_id}")
+                logging.info("✅ No reminders needed for stream %s", stream_id)
                 return
 
             # Get user details
-            client = self.bot_handler._client
-            users_response = client.get_users()
-
-            if users_response['result'] != 'success':
-                logging.error(f"❌ Failed to get user details for reminders")
+            directory = self._get_users_map(self.bot_handler)
+            if directory is None:
+                logging.error("❌ Failed to get user details for reminders")
                 return
+            users_map = directory[0]
 
-            users_map = {u['user_id']: u for u in users_response.get('members', [])}
             stream_name = prompt_data.get('stream_name', 'Unknown')
 
-            # Send reminders
-            reminder_count = 0
+            # Send reminders; every recipient gets the same text
+            reminder_message = _REMINDER_TEMPLATE.format(stream_name=stream_name)
+            outgoing = []
             for user_id in reminder_users:
-                user_id_int = int(user_id) if isinstance(user_id, str) else user_id
-
-                if user_id_int in users_map:
-                    user = users_map[user_id_int]
-                    user_email = user['email']
-
-                    reminder_message = f"""
-🔔 **Friendly reminder!**
-
-You haven't completed your standup for **{stream_name}** today.
-
-Please respond to complete your standup before the summary is posted.
-"""
+                user = users_map.get(user_id)
+                if user:
+                    outgoing.append((user['email'], reminder_message))
 
-                    try:
-                        self._send_private_message(self.bot_handler, user_email, reminder_message)
-                        reminder_count += 1
-                        logging.info(f"🔔 Sent reminder to {user_email}")
-                    except Exception as e:
-                        logging.error(f"❌ Failed to send reminder to {user_email}: {e}")
+            reminder_count = self._send_private_messages(outgoing, 'reminder')
 
             # Mark reminder as sent
-            database.mark_reminder_sent(stream_id, today)
+            database.mark_prompt_flag(stream_id, today, 'reminder_sent')
 
-            logging.info(f"🔔 Sent {reminder_count} reminders for stream {stream_id}")
+            logging.info("🔔 Sent %s reminders for stream %s", reminder_count, stream_id)
 
         except Exception as e:
-            logging.error(f"❌ Error sending reminders for stream {stream_id}: {e}", exc_info=True)
+            logging.error("❌ Error sending reminders for stream %s: %s", stream_id, e, exc_info=True)
 
     def _generate_and_post_summary(self, stream_id: str) -> None:
         """Generate and post standup summary to the channel."""
         try:
-            logging.info(f"📊 Generating summary for stream {stream_id}")
+            logging.info("📊 Generating summary for stream %s", stream_id)
 
-            today = datetime.datetime.now().strftime('%Y-%m-%d')
+            today = _today_str()
 
             # Get channel info
             channel = database.get_channel(stream_id)
             if not channel:
-                logging.error(f"❌ Channel {stream_id} not found for summary")
+                logging.error("❌ Channel %s not found for summary", stream_id)
                 return
 
             # Check if today is a holiday and we should skip
-            import datetime as dt
-            today_date = dt.date.today()
+            today_date = datetime.date.today()
             if not self._should_run_standup_on_date(today_date, channel):
-                logging.info(f"📅 Skipping summary for stream {stream_id} - Not a standup day")
+                logging.info("📅 Skipping summary for stream %s - Not a standup day", stream_id)
                 return
 
             stream_name = channel.get('stream_name', 'Unknown')
@@ -1539,15 +1614,11 @@ Please respond to complete your standup before the summary is posted.
             last_date, last_day_description = self._get_last_standup_day(channel)
 
             # Get all responses for today
-            responses = database.get_all_standup_responses_for_stream_and_date(stream_id, today)
+            responses = list(database.get_all_standup_responses_for_stream_and_date(stream_id, today))
 
             # Get user details for names
-            client = self.bot_handler._client
-            users_response = client.get_users()
-            users_map = {}
-
-            if users_response['result'] == 'success':
-                users_map = {u['user_id']: u for u in users_response.get('members', [])}
+            directory = self._get_users_map(self.bot_handler)
+            users_map = directory[0] if directory else {}
 
             if not responses:
                 # No responses received
@@ -1559,25 +1630,22 @@ No standup responses were received today for **{stream_name}**.
 💡 *Tip: Team members can respond to standup prompts via private message with the bot.*
 """
             else:
-                # Format responses for AI summary
+                # Format complete responses for AI summary
                 formatted_responses = []
-                completed_responses = []
 
                 for response in responses:
-                    user_id = response.get('user_id') or response.get('zulip_user_id')
-                    user_id_int = int(user_id) if user_id else None
-                    user_name = users_map.get(user_id_int, {}).get('full_name', f"User {user_id}")
-                    response_list = response.get('responses', [])
+                    response_list = response.get('responses') or []
+                    if len(response_list) < 3:
+                        continue
 
-                    if len(response_list) >= 3:
-                        # Complete response
-                        formatted_responses.append({
-                            'name': user_name,
-                            'yesterday': response_list[0],
-                            'today': response_list[1],
-                            'blockers': response_list[2]
-                        })
-                        completed_responses.append(response)
+                    user_id = response.get('user_id') or response.get('zulip_user_id')
+                    user = users_map.get(user_id)
+                    formatted_responses.append({
+                        'name': user['full_name'] if user else f"User {user_id}",
+                        'yesterday': response_list[0],
+                        'today': response_list[1],
+                        'blockers': response_list[2]
+                    })
 
                 # Generate summary using AI if available
                 if ai_summary.summary_generator.is_available() and formatted_responses:
@@ -1595,12 +1663,12 @@ No standup responses were received today for **{stream_name}**.
             )
 
             # Mark summary as sent
-            database.mark_summary_sent(stream_id, today)
+            database.mark_prompt_flag(stream_id, today, 'summary_sent')
 
-            logging.info(f"📊 Posted summary for stream {stream_id}")
+            logging.info("📊 Posted summary for stream %s", stream_id)
 
         except Exception as e:
-            logging.error(f"❌ Error generating summary for stream {stream_id}: {e}", exc_info=True)
+            logging.error("❌ Error generating summary for stream %s: %s", stream_id, e, exc_info=True)
 
     def _generate_manual_summary(self, responses: List[Dict[str, str]], date: str, stream_name: str, total_responses: int, last_day_description: str = "yesterday") -> str:
         """Generate a manual summary when AI is not available."""
@@ -1613,17 +1681,17 @@ No completed standup responses for **{stream_name}** today.
 *Total responses: {total_responses} (incomplete)*
 """
 
-        summary = f"""
+        parts = [f"""
 📊 **Daily Standup Summary - {date}**
 
 **Team:** {stream_name}
 **Participants:** {len(responses)} completed
 
-"""
+"""]
 
         # Group by themes if possible
         if len(responses) <= 8:  # Show individual updates for smaller teams
-            summary += "## 👥 Individual Updates\n\n"
+            parts.append("## 👥 Individual Updates\n\n")
 
             for response in responses:
                 name = response.get('name', 'Unknown')
@@ -1634,31 +1702,30 @@ No completed standup responses for **{stream_name}** today.
                 # Capitalize the first letter of the day description for display
                 day_label = last_day_description.capitalize()
                 
-                summary += f"**{name}**\n"
-                summary += f"• {day_label}: {yesterday}\n"
-                summary += f"• Today: {today}\n"
-                summary += f"• Blockers: {blockers}\n\n"
+                parts.append(
+                    f"**{name}**\n"
+                    f"• {day_label}: {yesterday}\n"
+                    f"• Today: {today}\n"
+                    f"• Blockers: {blockers}\n\n"
+                )
         else:
-            summary += f"## 📈 Team Activity Summary\n\n"
-            summary += f"✅ **{len(responses)} team members** completed their standup\n\n"
+            parts.append("## 📈 Team Activity Summary\n\n")
+            parts.append(f"✅ **{len(responses)} team members** completed their standup\n\n")
 
         # Add blockers section if any exist
-        blockers_exist = any(
-            response.get('blockers', 'None').lower() not in ['none', 'no', 'n/a', '', 'no blockers', 'nothing']
+        blocker_lines = [
+            f"• **{response.get('name', 'Unknown')}:** {blockers}\n"
             for response in responses
-        )
+            if (blockers := response.get('blockers', 'None')).strip().lower() not in _NO_BLOCKERS
+        ]
 
-        if blockers_exist:
-            summary += "## ⚠️ Blockers & Issues\n\n"
-            for response in responses:
-                name = response.get('name', 'Unknown')
-                blockers = response.get('blockers', 'None')
-                if blockers.lower() not in ['none', 'no', 'n/a', '', 'no blockers', 'nothing']:
-                    summary += f"• **{name}:** {blockers}\n"
-            summary += "\n"
+        if blocker_lines:
+            parts.append("## ⚠️ Blockers & Issues\n\n")
+            parts.extend(blocker_lines)
+            parts.append("\n")
 
-        summary += "---\n*Generated by Standup Bot*"
-        return summary
+        parts.append("---\n*Generated by Standup Bot*")
+        return "".join(parts)
 
     def _daily_maintenance(self) -> None:
         """Run daily maintenance tasks."""
@@ -1674,73 +1741,56 @@ No completed standup responses for **{stream_name}** today.
             logging.info("✅ Daily maintenance completed")
 
         except Exception as e:
-            logging.error(f"❌ Daily maintenance error: {e}", exc_info=True)
+            logging.error("❌ Daily maintenance error: %s", e, exc_info=True)
 
     # === HOLIDAY DETECTION UTILITIES ===
 
-    def _get_holiday_calendar(self, country: str):
-        """Get holiday calendar for the specified country."""
+    def _get_holiday_calendar(self, country: str, year: int) -> Optional[Dict[datetime.date, str]]:
+        """Get the holidays for the specified country and year."""
         try:
             import holidays
-            
-            country_map = {
-                'nigeria': holidays.Nigeria,
-                'ng': holidays.Nigeria,
-                'us': holidays.UnitedStates,
-                'usa': holidays.UnitedStates,
-                'united states': holidays.UnitedStates,
-                'united_states': holidays.UnitedStates,
-            }
-            
-            country_key = country.lower().strip()
-            holiday_class = country_map.get(country_key)
-            
-            if holiday_class:
-                return holiday_class()
-            else:
-                logging.warning(f"⚠️ Unsupported holiday country: {country}, falling back to Nigeria")
-                return holidays.Nigeria()
+
+            class_name = _HOLIDAY_CLASS_NAMES.get(country.lower().strip())
+            if not class_name:
+                logging.warning("⚠️ Unsupported holiday country: %s, falling back to Nigeria", country)
+                class_name = 'Nigeria'
+            holiday_class = getattr(holidays, class_name)
+
+            return _holiday_dates(holiday_class, year)
                 
         except ImportError:
             logging.error("❌ holidays library not installed, holiday detection disabled")
             return None
         except Exception as e:
-            logging.error(f"❌ Error creating holiday calendar for {country}: {e}")
+            logging.error("❌ Error creating holiday calendar for %s: %s", country, e)
             return None
 
     def _is_holiday(self, date_obj, country: str) -> bool:
         """Check if a given date is a holiday in the specified country."""
         try:
-            holiday_calendar = self._get_holiday_calendar(country)
+            holiday_calendar = self._get_holiday_calendar(country, date_obj.year)
             if holiday_calendar is None:
                 return False
             
             return date_obj in holiday_calendar
             
         except Exception as e:
-            logging.error(f"❌ Error checking holiday for {date_obj} in {country}: {e}")
+            logging.error("❌ Error checking holiday for %s in %s: %s", date_obj, country, e)
             return False
 
     def _get_holiday_name(self, date_obj, country: str) -> str:
         """Get the name of the holiday on the given date."""
         try:
-            holiday_calendar = self._get_holiday_calendar(country)
+            holiday_calendar = self._get_holiday_calendar(country, date_obj.year)
             if holiday_calendar is None:
                 return "Holiday"
             
             return holiday_calendar.get(date_obj, "Holiday")
             
         except Exception as e:
-            logging.error(f"❌ Error getting holiday name for {date_obj} in {country}: {e}")
+            logging.error("❌ Error getting holiday name for %s in %s: %s", date_obj, country, e)
             return "Holiday"
 
-    def _get_supported_countries(self) -> List[str]:
-        """Get list of supported holiday countries."""
-        return [
-            'Nigeria', 'ng',
-            'United States', 'US', 'USA'
-        ]
-
     # === DAY FILTERING UTILITIES ===
 
     def _parse_days_config(self, days_str: str) -> List[int]:
@@ -1752,11 +1802,11 @@ No completed standup responses for **{stream_name}** today.
             days_str = days_str.lower().strip()
             
             # Handle shortcuts
-            if days_str in ['weekdays', 'workdays']:
+            if days_str in _WEEKDAY_WORDS:
                 return [0, 1, 2, 3, 4]  # Mon-Fri
-            elif days_str in ['weekend']:
+            elif days_str == 'weekend':
                 return [5, 6]  # Sat-Sun
-            elif days_str in ['all', 'everyday', 'daily']:
+            elif days_str in _ALL_DAYS_WORDS:
                 return [0, 1, 2, 3, 4, 5, 6]  # All days
             
             # Parse comma-separated values
@@ -1768,24 +1818,14 @@ No completed standup responses for **{stream_name}** today.
                     day_num = int(day)
                     if 0 <= day_num <= 6:
                         days.append(day_num)
-                else:
+                elif day in _DAY_NUMBERS:
                     # Name format
-                    day_mapping = {
-                        'mon': 0, 'monday': 0,
-                        'tue': 1, 'tuesday': 1,
-                        'wed': 2, 'wednesday': 2,
-                        'thu': 3, 'thursday': 3,
-                        'fri': 4, 'friday': 4,
-                        'sat': 5, 'saturday': 5,
-                        'sun': 6, 'sunday': 6
-                    }
-                    if day in day_mapping:
-                        days.append(day_mapping[day])
+                    days.append(_DAY_NUMBERS[day])
             
             return sorted(list(set(days))) if days else [0, 1, 2, 3, 4]
             
         except Exception as e:
-            logging.error(f"❌ Error parsing days config '{days_str}': {e}")
+            logging.error("❌ Error parsing days config '%s': %s", days_str, e)
             return [0, 1, 2, 3, 4]  # Default to weekdays on error
 
     def _validate_days_config(self, days_str: str) -> bool:
@@ -1811,7 +1851,6 @@ No completed standup responses for **{stream_name}** today.
     def _should_run_standup_on_date(self, check_date, channel_config: Dict[str, Any]) -> bool:
         """Check if standup should run on a given date (considering days and holidays)."""
         try:
-            import datetime
             
             # Check if it's in allowed days
             days_config = channel_config.get('days', 'mon,tue,wed,thu,fri')
@@ -1830,7 +1869,7 @@ No completed standup responses for **{stream_name}** today.
             return True
             
         except Exception as e:
-            logging.error(f"❌ Error checking if standup should run on {check_date}: {e}")
+            logging.error("❌ Error checking if standup should run on %s: %s", check_date, e)
             return True  # Default to running if there's an error
 
     def _get_last_standup_day(self, channel_config: Dict[str, Any]) -> Tuple[str, str]:
@@ -1839,7 +1878,6 @@ No completed standup responses for **{stream_name}** today.
         Returns tuple of (date_string, day_description) for use in prompts.
         """
         try:
-            import datetime
             
             days_config = channel_config.get('days', 'mon,tue,wed,thu,fri')
             allowed_days = self._parse_days_config(days_config)
@@ -1884,8 +1922,7 @@ No completed standup responses for **{stream_name}** today.
             return (today - datetime.timedelta(days=1)).strftime('%Y-%m-%d'), "your last work session"
             
         except Exception as e:
-            logging.error(f"❌ Error calculating last standup day: {e}")
-            import datetime
+            logging.error("❌ Error calculating last standup day: %s", e)
             return (datetime.date.today() - datetime.timedelta(days=1)).strftime('%Y-%m-%d'), "yesterday"
 
     def _get_user_previous_commitments(self, user_id: str, stream_id: str, last_date: str) -> Optional[str]:
@@ -1904,7 +1941,7 @@ No completed standup responses for **{stream_name}** today.
             return None
             
         except Exception as e:
-            logging.error(f"❌ Error retrieving previous commitments for user {user_id}: {e}")
+            logging.error("❌ Error retrieving previous commitments for user %s: %s", user_id, e)
             return None
 
     # === UTILITY METHODS ===
@@ -1912,14 +1949,13 @@ No completed standup responses for **{stream_name}** today.
     def _format_time_with_timezone(self, time_str: str, timezone_str: str) -> str:
         """Format time showing both channel timezone and UTC equivalent."""
         try:
-            hour, minute = map(int, time_str.split(':'))
-            channel_tz = pytz.timezone(timezone_str)
-            utc_tz = pytz.UTC
+            hour, minute = _parse_time(time_str)
+            channel_tz = ZoneInfo(timezone_str)
+            utc_tz = datetime.timezone.utc
             
             # Create a dummy date to calculate timezone offset
-            import datetime
             today = datetime.date.today()
-            dt_channel = channel_tz.localize(datetime.datetime.combine(today, datetime.time(hour, minute)))
+            dt_channel = datetime.datetime.combine(today, datetime.time(hour, minute), tzinfo=channel_tz)
             dt_utc = dt_channel.astimezone(utc_tz)
             
             utc_time_str = dt_utc.strftime('%H:%M')
@@ -1930,49 +1966,93 @@ No completed standup responses for **{stream_name}** today.
                 return f"{time_str} {timezone_str} ({utc_time_str} UTC)"
                 
         except Exception as e:
-            logging.error(f"❌ Error formatting time: {e}")
+            logging.error("❌ Error formatting time: %s", e)
             return f"{time_str} {timezone_str}"
 
     def _calculate_next_run_times(self, channel: Dict[str, Any], timezone: str) -> str:
         """Calculate next run times for a channel."""
         try:
-            import pytz
-            from datetime import datetime, timedelta
-
-            tz = pytz.timezone(timezone)
-            now = datetime.now(tz)
+            tz = ZoneInfo(timezone)
+            now = datetime.datetime.now(tz)
 
             prompt_time = channel.get('prompt_time', '09:30')
             reminder_time = channel.get('reminder_time', '11:45')
             cutoff_time = channel.get('cutoff_time', '12:45')
 
-            next_times = ""
+            # The text only changes with the config or the clock minute
+            stream_id = channel.get('zulip_stream_id')
+            signature = (prompt_time, reminder_time, cutoff_time, timezone,
+                         now.replace(second=0, microsecond=0))
+            cached = self._next_run_cache.get(stream_id)
+            if cached and cached[0] == signature:
+                return cached[1]
+
+            lines = []
 
             for label, time_str in [("Prompt", prompt_time), ("Reminder", reminder_time), ("Summary", cutoff_time)]:
                 try:
-                    hour, minute = map(int, time_str.split(':'))
+                    hour, minute = _parse_time(time_str)
                     next_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
                     if next_time <= now:
-                        next_time += timedelta(days=1)
+                        next_time += datetime.timedelta(days=1)
 
                     # Convert to UTC for display
-                    next_time_utc = next_time.astimezone(pytz.UTC)
+                    next_time_utc = next_time.astimezone(datetime.timezone.utc)
 
                     time_until = next_time - now
                     hours_until = time_until.total_seconds() / 3600
 
-                    next_times += f"• **{label}:** {next_time_utc.strftime('%H:%M UTC')} ({hours_until:.1f}h)\n"
+                    lines.append(f"• **{label}:** {next_time_utc.strftime('%H:%M UTC')} ({hours_until:.1f}h)\n")
 
                 except Exception:
-                    next_times += f"• **{label}:** Invalid time format\n"
+                    lines.append(f"• **{label}:** Invalid time format\n")
 
+            next_times = "".join(lines)
+            if stream_id is not None:
+                self._next_run_cache[stream_id] = (signature, next_times)
             return next_times
 
         except Exception as e:
-            logging.error(f"❌ Error calculating next run times: {e}")
+            logging.error("❌ Error calculating next run times: %s", e)
             return "• Error calculating next run times\n"
 
+    def _get_users_map(
+        self, bot_handler: AbstractBotHandler, ttl: float = 60
+    ) -> Optional[Tuple[Dict[str, Dict[str, Any]], Set[str]]]:
+        """
+        Get Zulip users keyed by user ID as a string (the form the database stores),
+        together with the set of non-bot user IDs, refetching at most every ttl seconds.
+        Returns None if the users could not be fetched.
+        """
+        fetched_at, users_map, human_user_ids = self._users_cache
+        if users_map and time.monotonic() - fetched_at < ttl:
+            return users_map, human_user_ids
+
+        # Jobs for several streams often fire in the same minute; let one of them fetch
+        with self._users_lock:
+            fetched_at, users_map, human_user_ids = self._users_cache
+            if users_map and time.monotonic() - fetched_at < ttl:
+                return users_map, human_user_ids
+
+            # The API has no field projection; skip avatar URLs and profile fields at least
+            users_response = bot_handler._client.get_users(
+                {'client_gravatar': True, 'include_custom_profile_fields': False}
+            )
+            if users_response['result'] != 'success':
+                logging.error("❌ Failed to get user details: %s", users_response)
+                return None
+
+            # Keep only the fields the bot reads, so the cached directory stays small
+            members = users_response.get('members', [])
+            users_map = {
+                str(u['user_id']): {'full_name': u.get('full_name', ''), 'email': u.get('email', '')}
+                for u in members
+            }
+            human_user_ids = {str(u['user_id']) for u in members if not u.get('is_bot', False)}
+            self._users_cache = (time.monotonic(), users_map, human_user_ids)
+            return users_map, human_user_ids
+
     def _send_private_message(self, bot_handler: AbstractBotHandler, user_email: str, content: str) -> None:
         """Send a private message to a user."""
         message = {
@@ -1982,6 +2062,20 @@ No completed standup responses for **{stream_name}** today.
         }
         bot_handler.send_message(message)
 
+    def _send_private_messages(self, messages: List[Tuple[str, str]], kind: str) -> int:
+        """Send (email, content) private messages on the send pool; return how many succeeded."""
+        def send(email_and_content: Tuple[str, str]) -> bool:
+            user_email, content = email_and_content
+            try:
+                self._send_private_message(self.bot_handler, user_email, content)
+                logging.info("✅ Sent %s to %s", kind, user_email)
+                return True
+            except Exception as e:
+                logging.error("❌ Failed to send %s to %s: %s", kind, user_email, e)
+                return False
+
+        return sum(self._send_pool.map(send, messages))
+
     def _send_stream_message(self, bot_handler: AbstractBotHandler, stream: str, topic: str, content: str) -> None:
         """Send a message to a stream."""
         message = {
@@ -1994,21 +2088,13 @@ No completed standup responses for **{stream_name}** today.
 
     def _is_valid_time(self, time_str: str) -> bool:
         """Validate time format (HH:MM)."""
-        pattern = re.compile(r'^([01]\d|2[0-3]):([0-5]\d)$')
-        return bool(pattern.match(time_str))
+        return _TIME_RE.match(time_str) is not None
 
     def _validate_time_sequence(self, prompt_time: str, reminder_time: str, cutoff_time: str) -> bool:
         """Validate that times are in correct sequence."""
         try:
-            def time_to_minutes(time_str: str) -> int:
-                hour, minute = map(int, time_str.split(':'))
-                return hour * 60 + minute
-
-            prompt_min = time_to_minutes(prompt_time)
-            reminder_min = time_to_minutes(reminder_time)
-            cutoff_min = time_to_minutes(cutoff_time)
-
-            return prompt_min < reminder_min < cutoff_min
+            # (hour, minute) tuples compare in time order
+            return _parse_time(prompt_time) < _parse_time(reminder_time) < _parse_time(cutoff_time)
 
         except (ValueError, IndexError):
             return False
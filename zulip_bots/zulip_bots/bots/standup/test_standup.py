@@ -51,6 +51,14 @@ class TestStandupBot(BotTestCase, DefaultTests):
             # Should show usage information
             self.assertIn("Standup Bot", response["content"])
 
+    def test_plain_stream_message_is_ignored(self) -> None:
+        """Test ordinary stream chatter gets no reply (and no error reply)."""
+        with self.mock_config_info({}):
+            bot, bot_handler = self._get_handlers()
+            bot_handler.reset_transcript()
+            bot.handle_message(self.make_request_message("just chatting about the release"), bot_handler)
+            self.assertEqual(bot_handler.transcript, [])
+
     def make_request_message(self, content: str) -> dict:
         """Create a test message."""
         return {